@@ -13,14 +13,23 @@ Key Features:
 - Support for various lease formats
 """
 
+import asyncio
+import hashlib
+import json
+import os
 import time
-from typing import Optional, Any
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Any, Generator, Iterator, Sequence, Union
 
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
+from langchain_core.utils.json import parse_partial_json
 from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from src.config import get_settings
 from src.schemas.amendment import Amendment
@@ -63,12 +72,36 @@ class ExtractionResult(BaseModel):
     raw_response: Optional[str] = Field(default=None, description="Raw LLM response")
 
 
-# Primary extraction prompt for base leases
-LEASE_EXTRACTION_PROMPT = PromptTemplate.from_template("""
-You are an expert commercial real estate analyst specializing in lease abstraction.
-Extract all available information from the following lease document.
+class BatchLeaseItem(BaseModel):
+    """
+    One document's entry in a batch extraction response.
+    
+    Attributes:
+        document_id: Identifier from the document's batch markers
+        lease: Extracted lease data, or None if nothing could be extracted
+    """
+    document_id: str = Field(..., description="Document id from the batch markers")
+    lease: Optional[Lease] = Field(default=None, description="Extracted lease")
 
-IMPORTANT GUIDELINES:
+
+class BatchLeaseExtraction(BaseModel):
+    """
+    Structured response for a batch of lease documents.
+    
+    Attributes:
+        results: One entry per document in the batch
+    """
+    results: list[BatchLeaseItem] = Field(
+        default_factory=list, description="One entry per document"
+    )
+
+
+# Bump when the extraction prompts or Lease schema change so cached
+# extractions from the old version are ignored
+PROMPT_VERSION = 1
+
+# Extraction guidelines shared by the single and batch lease prompts
+LEASE_EXTRACTION_GUIDELINES = """IMPORTANT GUIDELINES:
 1. Extract data exactly as it appears in the document
 2. For fields that are not present OR incomplete, use null (do not create partial objects)
 3. Never use the string "null" - either provide a real value or omit the field
@@ -99,7 +132,15 @@ ADDITIONAL EXTRACTION REQUIREMENTS:
     - Critical dates and financial terms
     - What a property manager needs to know at a glance
 
-{format_instructions}
+"""
+
+
+# Primary extraction prompt for base leases
+LEASE_EXTRACTION_PROMPT = PromptTemplate.from_template("""
+You are an expert commercial real estate analyst specializing in lease abstraction.
+Extract all available information from the following lease document.
+
+""" + LEASE_EXTRACTION_GUIDELINES + """{format_instructions}
 
 LEASE DOCUMENT:
 ---
@@ -110,6 +151,26 @@ Extract all lease information following the schema above.
 """)
 
 
+# Batch extraction prompt: several leases in one request, so the fixed
+# instructions and schema are sent once for the whole batch
+BATCH_LEASE_EXTRACTION_PROMPT = PromptTemplate.from_template("""
+You are an expert commercial real estate analyst specializing in lease abstraction.
+Extract all available information from EACH of the following lease documents.
+
+""" + LEASE_EXTRACTION_GUIDELINES + """BATCH RULES:
+- Each document is enclosed in "=== DOC <id> START ===" and "=== DOC <id> END ===" markers
+- Extract every document independently; never carry data from one document into another
+- Return exactly one entry in "results" per document, with "document_id" set to the id from its markers
+
+{format_instructions}
+
+LEASE DOCUMENTS:
+{documents}
+
+Extract all lease information for every document following the schema above.
+""")
+
+
 # Secondary extraction prompt for amendments
 AMENDMENT_EXTRACTION_PROMPT = PromptTemplate.from_template("""
 You are an expert commercial real estate analyst specializing in lease amendments.
@@ -151,6 +212,7 @@ class LeaseExtractorAgent:
         model_name: Optional[str] = None,
         temperature: float = 0.0,
         verbose: bool = False,
+        max_retries: int = 2,
     ) -> None:
         """
         Initialize the Lease Extractor agent.
@@ -159,19 +221,24 @@ class LeaseExtractorAgent:
             model_name: OpenAI model to use (defaults to settings)
             temperature: LLM temperature (0 = deterministic)
             verbose: Enable verbose chain output
+            max_retries: Retries for transient API errors, and re-prompts
+                when a reply fails schema validation
         """
         self.settings = get_settings()
         self.model_name = model_name or self.settings.openai_model
         self.temperature = temperature
         self.verbose = verbose
+        self.max_retries = max_retries
         
         self._llm: Optional[ChatOpenAI] = None
-        self._lease_chain: Optional[RunnableSequence] = None
+        self._lease_stream_chain: Optional[RunnableSequence] = None
         self._amendment_chain: Optional[RunnableSequence] = None
+        self._batch_lease_chain: Optional[RunnableSequence] = None
         
         # Output parsers
         self._lease_parser = PydanticOutputParser(pydantic_object=Lease)
         self._amendment_parser = PydanticOutputParser(pydantic_object=Amendment)
+        self._batch_lease_parser = PydanticOutputParser(pydantic_object=BatchLeaseExtraction)
     
     @property
     def llm(self) -> ChatOpenAI:
@@ -181,22 +248,25 @@ class LeaseExtractorAgent:
                 model=self.model_name,
                 temperature=self.temperature,
                 api_key=self.settings.openai_api_key.get_secret_value(),
+                # Rate limits and timeouts: the OpenAI client retries
+                # these itself with exponential backoff
+                max_retries=self.max_retries,
             )
         return self._llm
     
-    def _build_lease_chain(self) -> RunnableSequence:
+    def _build_lease_stream_chain(self) -> RunnableSequence:
         """
-        Build the LCEL chain for lease extraction.
+        Build the LCEL chain for streaming lease extraction.
         
         Returns:
-            Configured runnable chain for base lease extraction
+            Runnable chain yielding the raw JSON text as it is generated
         """
         prompt = LEASE_EXTRACTION_PROMPT.partial(
             format_instructions=self._lease_parser.get_format_instructions()
         )
         
-        # LCEL: prompt | llm | parser
-        return prompt | self.llm | self._lease_parser
+        # LCEL: prompt | llm | text (parsed incrementally by the caller)
+        return prompt | self.llm | StrOutputParser()
     
     def _build_amendment_chain(self) -> RunnableSequence:
         """
@@ -212,12 +282,27 @@ class LeaseExtractorAgent:
         # LCEL: prompt | llm | parser
         return prompt | self.llm | self._amendment_parser
     
+    def _build_batch_lease_chain(self) -> RunnableSequence:
+        """
+        Build the LCEL chain for batch lease extraction.
+        
+        Returns:
+            Runnable chain yielding the raw reply for several base leases
+        """
+        prompt = BATCH_LEASE_EXTRACTION_PROMPT.partial(
+            format_instructions=self._batch_lease_parser.get_format_instructions()
+        )
+        
+        # LCEL: prompt | llm | text (parsed by the caller, which keeps the
+        # raw reply for each result)
+        return prompt | self.llm | StrOutputParser()
+    
     @property
-    def lease_chain(self) -> RunnableSequence:
-        """Get or create the lease extraction chain."""
-        if self._lease_chain is None:
-            self._lease_chain = self._build_lease_chain()
-        return self._lease_chain
+    def lease_stream_chain(self) -> RunnableSequence:
+        """Get or create the streaming lease extraction chain."""
+        if self._lease_stream_chain is None:
+            self._lease_stream_chain = self._build_lease_stream_chain()
+        return self._lease_stream_chain
     
     @property
     def amendment_chain(self) -> RunnableSequence:
@@ -226,6 +311,13 @@ class LeaseExtractorAgent:
             self._amendment_chain = self._build_amendment_chain()
         return self._amendment_chain
     
+    @property
+    def batch_lease_chain(self) -> RunnableSequence:
+        """Get or create the batch lease extraction chain."""
+        if self._batch_lease_chain is None:
+            self._batch_lease_chain = self._build_batch_lease_chain()
+        return self._batch_lease_chain
+    
     def _preprocess_document(self, document_text: str) -> str:
         """
         Preprocess document text for extraction.
@@ -305,55 +397,262 @@ class LeaseExtractorAgent:
         # Start timing
         start_time = time.time()
         
-        # STEP 1: Validate input
+        # STEP 1-2: Validate input and preprocess
+        cleaned_text = self._prepare_lease_input(document_text, document_id)
+        
+        # STEP 3: Run extraction, re-prompting with the error if the reply
+        # does not validate
+        conversation = self._lease_conversation(cleaned_text)
+        try:
+            messages, delay = next(conversation)
+            while True:
+                if delay:
+                    time.sleep(delay)
+                messages, delay = conversation.send(self.llm.invoke(messages))
+        except StopIteration as done:
+            lease, reply = done.value
+        except Exception as e:
+            # If extraction fails, return empty result with error
+            return self._failed_result(e, start_time)
+        
+        return self.build_lease_result(lease, document_id, reply.content, start_time)
+    
+    def extract_lease_stream(
+        self,
+        document_text: str,
+        document_id: str,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Stream a base lease extraction, yielding results as fields complete.
+        
+        A top-level field counts as complete once the model starts writing
+        the next one, so intermediate results never contain half-generated
+        values. Each intermediate result holds the complete fields so far;
+        the last result yielded is the final one, as extract_lease would
+        return it.
+        
+        Args:
+            document_text: Full text content of the lease
+            document_id: Unique identifier for the document
+            
+        Yields:
+            ExtractionResult with the lease data extracted so far
+            
+        Raises:
+            ValueError: If document_text is empty
+        """
+        start_time = time.time()
+        cleaned_text = self._prepare_lease_input(document_text, document_id)
+        
+        chunks: list[str] = []
+        completed = 0
+        try:
+            for chunk in self.lease_stream_chain.stream({"document_text": cleaned_text}):
+                chunks.append(chunk)
+                # A top-level value can only complete at a separator
+                if "," not in chunk and "}" not in chunk:
+                    continue
+                
+                text = "".join(chunks)
+                start = text.find("{")
+                try:
+                    partial = parse_partial_json(text[start:]) if start >= 0 else None
+                except ValueError:
+                    partial = None
+                if not isinstance(partial, dict):
+                    continue
+                
+                # The last key may still be streaming
+                done_keys = list(partial)[:-1]
+                if len(done_keys) <= completed:
+                    continue
+                try:
+                    lease = Lease.model_validate({key: partial[key] for key in done_keys})
+                except ValueError:
+                    continue
+                completed = len(done_keys)
+                yield self.build_lease_result(lease, document_id, text, start_time)
+            
+            raw_response_text = "".join(chunks)
+            lease = self._lease_parser.parse(raw_response_text)
+        except Exception as e:
+            yield self._failed_result(e, start_time)
+            return
+        
+        yield self.build_lease_result(lease, document_id, raw_response_text, start_time)
+    
+    def _prepare_lease_input(self, document_text: str, document_id: str) -> str:
+        """
+        Validate extraction input and return the preprocessed text.
+        
+        Raises:
+            ValueError: If document_text is empty or document_id is missing
+        """
         if not document_text or not document_text.strip():
             raise ValueError("Document text cannot be empty")
         
         if not document_id:
             raise ValueError("Document ID is required")
         
-        # STEP 2: Preprocess
-        cleaned_text = self._preprocess_document(document_text)
+        return self._preprocess_document(document_text)
+    
+    def _render_lease_prompt(self, cleaned_text: str) -> str:
+        """Render the lease extraction prompt for preprocessed text."""
+        return LEASE_EXTRACTION_PROMPT.format(
+            format_instructions=self._lease_parser.get_format_instructions(),
+            document_text=cleaned_text,
+        )
+    
+    def _lease_conversation(
+        self,
+        cleaned_text: str,
+    ) -> Generator[tuple[list[BaseMessage], float], AIMessage, tuple[Lease, AIMessage]]:
+        """
+        Run the extraction retry policy, independent of how the model is called.
+        
+        Shared by extract_lease and extract_lease_async, which only perform
+        the waits and model calls. Each yielded (messages, delay) pair asks
+        the caller to wait delay seconds, send messages to the model and
+        pass the reply back with send(). A reply that fails to parse is
+        answered with its error, up to max_retries times, waiting one
+        second longer before each retry.
         
-        # STEP 3: Run extraction chain
-        try:
-            # Invoke the chain
-            response = self.lease_chain.invoke({
-                "document_text": cleaned_text
-            })
+        Returns:
+            (lease, reply) for the first reply that parses, as the
+            StopIteration value
             
-            # Extract the parsed lease from response
-            # LangChain with output_parser might return the parsed object in different keys
-            if isinstance(response, Lease):
-                lease = response
-                raw_response_text = str(response)
-            elif isinstance(response, dict) and "text" in response:
-                lease = response["text"]
-                raw_response_text = str(response.get("text", ""))
-            elif isinstance(response, dict) and "output" in response:
-                lease = response["output"]
-                raw_response_text = str(response.get("output", ""))
-            else:
-                # Fallback: try to get the parsed result directly
-                lease = response
-                raw_response_text = str(response)
+        Raises:
+            OutputParserException: If the final allowed reply does not parse
+        """
+        messages: list[BaseMessage] = [HumanMessage(content=self._render_lease_prompt(cleaned_text))]
+        delay = 0.0
+        for attempt in range(self.max_retries + 1):
+            reply = yield messages, delay
+            try:
+                return self._lease_parser.parse(reply.content), reply
+            except OutputParserException as e:
+                if attempt == self.max_retries:
+                    raise
+                messages = self._with_retry_feedback(messages, reply, e)
+                delay = 1.0 * (attempt + 1)
+    
+    @staticmethod
+    def _with_retry_feedback(
+        messages: list[BaseMessage],
+        reply: AIMessage,
+        error: OutputParserException,
+    ) -> list[BaseMessage]:
+        """
+        Extend a conversation with a rejected reply and the error to fix.
+        
+        Only the underlying JSON or validation error is quoted: the parser
+        exception's own message embeds the whole completion, which the
+        conversation already holds as the reply.
+        """
+        cause = error.__cause__
+        if isinstance(cause, ValidationError):
+            detail = "; ".join(
+                f"{'.'.join(map(str, err['loc'])) or 'lease'}: {err['msg']}"
+                for err in cause.errors()
+            )
+        elif cause is not None:
+            detail = str(cause)
+        else:
+            detail = str(error).split("\n", 1)[0]
+        
+        return [
+            *messages,
+            reply,
+            HumanMessage(content=f"Your output had error: {detail}. Fix and retry."),
+        ]
+    
+    def build_lease_prompt(self, document_text: str) -> str:
+        """
+        Render the complete single-lease extraction prompt for a document.
+        
+        Used to submit extraction requests outside the chain, e.g. through
+        the OpenAI Batch API. The reply is handled by parse_lease_response.
+        
+        Args:
+            document_text: Full text content of the lease
             
-            # Ensure we got a Lease object
-            if not isinstance(lease, Lease):
-                raise ValueError(f"Expected Lease object, got {type(lease)}")
+        Returns:
+            Prompt text, exactly as extract_lease would send it
+        """
+        return self._render_lease_prompt(self._preprocess_document(document_text))
+    
+    def parse_lease_response(
+        self,
+        response_text: str,
+        document_id: str,
+        start_time: Optional[float] = None,
+    ) -> ExtractionResult:
+        """
+        Parse a raw model reply to build_lease_prompt into a result.
+        
+        Args:
+            response_text: Model output text
+            document_id: Unique identifier for the document
+            start_time: time.time() when the request was submitted
             
+        Returns:
+            ExtractionResult with lease data and metadata, or a failed
+            result if the reply does not parse
+        """
+        start_time = time.time() if start_time is None else start_time
+        try:
+            lease = self._lease_parser.parse(response_text)
         except Exception as e:
-            # If extraction fails, return empty result with error
-            return ExtractionResult(
-                lease=None,
-                metadata=ExtractionMetadata(
-                    total_fields=0,
-                    extracted_fields=0,
-                    missing_fields=["extraction_failed"],
-                    processing_time_seconds=time.time() - start_time
-                ),
-                raw_response=f"Error: {str(e)}"
-            )
+            return self._failed_result(e, start_time)
+        
+        return self.build_lease_result(lease, document_id, response_text, start_time)
+    
+    def _failed_result(self, error: Exception, start_time: float) -> ExtractionResult:
+        """
+        Build the empty result returned when extraction fails.
+        
+        Args:
+            error: Exception raised during extraction
+            start_time: time.time() when extraction started
+            
+        Returns:
+            ExtractionResult without data, carrying the error message
+        """
+        return ExtractionResult(
+            lease=None,
+            metadata=ExtractionMetadata(
+                total_fields=0,
+                extracted_fields=0,
+                missing_fields=["extraction_failed"],
+                processing_time_seconds=time.time() - start_time
+            ),
+            raw_response=f"Error: {str(error)}"
+        )
+    
+    def build_lease_result(
+        self,
+        lease: Lease,
+        document_id: str,
+        raw_response_text: Optional[str],
+        start_time: Optional[float] = None,
+    ) -> ExtractionResult:
+        """
+        Post-process an extracted lease and compute its metadata.
+        
+        Also used to rebuild results for leases obtained elsewhere, e.g.
+        from LeaseExtractionCache.
+        
+        Args:
+            lease: Lease parsed from the LLM response
+            document_id: Unique identifier for the document
+            raw_response_text: Raw LLM response for debugging (None when
+                the reply is not available)
+            start_time: time.time() when extraction started (defaults to now)
+            
+        Returns:
+            ExtractionResult with lease data and metadata
+        """
+        start_time = time.time() if start_time is None else start_time
         
         # STEP 4: Post-process lease object
         lease.document_id = document_id
@@ -399,6 +698,69 @@ class LeaseExtractorAgent:
             raw_response=raw_response_text
         )
     
+    def extract_leases_batch(
+        self,
+        documents: Sequence[tuple[str, str]],
+    ) -> dict[str, ExtractionResult]:
+        """
+        Extract several base leases with a single LLM request.
+        
+        The instructions and schema are sent once for the whole batch
+        instead of once per document. Each document is delimited by
+        ``=== DOC <id> START/END ===`` markers and the model returns one
+        result per document id. Keep batches small enough that all
+        documents fit the model's context window together.
+        
+        Args:
+            documents: (document_id, document_text) pairs
+            
+        Returns:
+            ExtractionResult per document id, in input order. A document
+            missing from the response gets a failed result.
+            
+        Raises:
+            ValueError: If a document is empty or ids are missing or repeated
+        """
+        start_time = time.time()
+        
+        document_ids = [document_id for document_id, _ in documents]
+        if not all(document_ids):
+            raise ValueError("Document ID is required")
+        if len(set(document_ids)) != len(document_ids):
+            raise ValueError("Document IDs must be unique within a batch")
+        if any(not text or not text.strip() for _, text in documents):
+            raise ValueError("Document text cannot be empty")
+        if not documents:
+            return {}
+        
+        blocks = "\n\n".join(
+            f"=== DOC {document_id} START ===\n"
+            f"{self._preprocess_document(text)}\n"
+            f"=== DOC {document_id} END ==="
+            for document_id, text in documents
+        )
+        
+        try:
+            raw_response_text = self.batch_lease_chain.invoke({"documents": blocks})
+            response = self._batch_lease_parser.parse(raw_response_text)
+        except Exception as e:
+            return {document_id: self._failed_result(e, start_time) for document_id in document_ids}
+        
+        leases = {item.document_id: item.lease for item in response.results}
+        results: dict[str, ExtractionResult] = {}
+        for document_id in document_ids:
+            lease = leases.get(document_id)
+            if lease is None:
+                results[document_id] = self._failed_result(
+                    ValueError(f"No lease returned for document {document_id}"), start_time
+                )
+            else:
+                # Every result shares the one reply string; nothing is copied
+                results[document_id] = self.build_lease_result(
+                    lease, document_id, raw_response_text, start_time
+                )
+        return results
+    
     def extract_amendment(
         self,
         document_text: str,
@@ -436,9 +798,26 @@ class LeaseExtractorAgent:
             
         Returns:
             ExtractionResult with lease data and metadata
+            
+        Raises:
+            ValueError: If document_text is empty
         """
-        # TODO: Implement async extraction
-        raise NotImplementedError("Async extraction not yet implemented")
+        start_time = time.time()
+        cleaned_text = self._prepare_lease_input(document_text, document_id)
+        
+        conversation = self._lease_conversation(cleaned_text)
+        try:
+            messages, delay = next(conversation)
+            while True:
+                if delay:
+                    await asyncio.sleep(delay)
+                messages, delay = conversation.send(await self.llm.ainvoke(messages))
+        except StopIteration as done:
+            lease, reply = done.value
+        except Exception as e:
+            return self._failed_result(e, start_time)
+        
+        return self.build_lease_result(lease, document_id, reply.content, start_time)
     
     def extract_with_multipass(
         self,
@@ -467,6 +846,152 @@ class LeaseExtractorAgent:
         raise NotImplementedError("Multi-pass extraction not yet implemented")
 
 
+class LeaseExtractionCache:
+    """
+    Content-addressed on-disk cache of lease extractions.
+    
+    Entries are JSON files named by a SHA-256 key over provider, model,
+    PROMPT_VERSION, document ID and document text, so re-running an
+    unchanged document skips the LLM call entirely. The model's original
+    reply is stored alongside the lease, so a cache hit reports the same
+    raw_response as the extraction did. Cached leases are revalidated
+    against the current Lease schema on read; unreadable or invalid
+    entries are treated as misses.
+    
+    Example:
+        >>> cache = LeaseExtractionCache.from_env()  # None unless LEASE_CACHE_DIR is set
+        >>> if cache is not None:
+        ...     result = cache.extract(extractor, lease_text, "lease-001")
+    """
+    
+    ENV_VAR = "LEASE_CACHE_DIR"
+    PROVIDER = "openai"
+    
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries (e.g. .cache/lease_extract)
+        """
+        self.cache_dir = Path(cache_dir)
+    
+    @classmethod
+    def from_env(cls) -> Optional["LeaseExtractionCache"]:
+        """Create a cache in $LEASE_CACHE_DIR, or return None if it is unset."""
+        cache_dir = os.getenv(cls.ENV_VAR)
+        return cls(cache_dir) if cache_dir else None
+    
+    def key(self, document_text: str, document_id: str, model_name: str) -> str:
+        """
+        Compute the cache key for one extraction.
+        
+        The document text is length-prefixed before hashing so the text
+        and the fields after it can never run together ambiguously.
+        """
+        text_bytes = document_text.encode("utf-8")
+        digest = hashlib.sha256(len(text_bytes).to_bytes(8, "big") + text_bytes)
+        for part in (self.PROVIDER, model_name, str(PROMPT_VERSION), document_id):
+            digest.update(b"\0" + part.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Lease]:
+        """Return the cached lease for a key, or None on a miss."""
+        entry = self._read(key)
+        return entry[0] if entry is not None else None
+    
+    def _read(self, key: str) -> Optional[tuple[Lease, Optional[str]]]:
+        """Return the cached lease and raw model reply for a key, or None on a miss."""
+        try:
+            entry = json.loads((self.cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+            lease = Lease.model_validate(entry["lease"])
+        except (OSError, ValueError, KeyError, TypeError, ValidationError):
+            return None
+        
+        raw_response = entry.get("raw_response")
+        return lease, raw_response if isinstance(raw_response, str) else None
+    
+    def put(
+        self,
+        key: str,
+        lease: Lease,
+        model_name: str,
+        raw_response: Optional[str] = None,
+    ) -> None:
+        """
+        Store a lease under a key.
+        
+        Args:
+            key: Cache key from key()
+            lease: Extracted lease
+            model_name: Model that produced the lease
+            raw_response: The model's reply the lease was parsed from
+        """
+        entry = {
+            "provider": self.PROVIDER,
+            "model": model_name,
+            "prompt_version": PROMPT_VERSION,
+            "document_id": lease.document_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "lease": lease.model_dump(mode="json"),
+            "raw_response": raw_response,
+        }
+        
+        # Write then rename so concurrent runs never read a partial entry
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.cache_dir / f"{key}.json"
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+    
+    def cached_result(
+        self,
+        extractor: LeaseExtractorAgent,
+        key: str,
+        document_id: str,
+    ) -> Optional[ExtractionResult]:
+        """
+        Rebuild an ExtractionResult from a cache hit, or return None.
+        
+        raw_response is the stored model reply, or None for entries
+        written without one.
+        """
+        start_time = time.time()
+        entry = self._read(key)
+        if entry is None:
+            return None
+        lease, raw_response = entry
+        return extractor.build_lease_result(lease, document_id, raw_response, start_time)
+    
+    def extract(
+        self,
+        extractor: LeaseExtractorAgent,
+        document_text: str,
+        document_id: str,
+    ) -> ExtractionResult:
+        """
+        Extract a lease, answering from the cache when possible.
+        
+        Args:
+            extractor: Agent used on a cache miss
+            document_text: Full text content of the lease
+            document_id: Unique identifier for the document
+            
+        Returns:
+            ExtractionResult with lease data and metadata
+        """
+        key = self.key(document_text, document_id, extractor.model_name)
+        result = self.cached_result(extractor, key, document_id)
+        if result is None:
+            result = extractor.extract_lease(document_text, document_id)
+            if result.lease is not None:
+                self.put(key, result.lease, extractor.model_name, result.raw_response)
+        return result
+
+
 # TODO: Add support for custom extraction prompts per client
 # TODO: Add extraction templates for common lease formats
 # TODO: Add field-level confidence scoring
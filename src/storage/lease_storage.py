@@ -1,12 +1,19 @@
+import argparse
 import json
 import os
+import sys
 import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from src.schemas.lease import Lease
 
+# Built once at import so deserialization reuses the compiled validator
+_LEASE_ADAPTER = TypeAdapter(Lease)
+
 class LeaseStorage:
     """
     Thread-safe JSON file storage for lease data.
@@ -50,7 +57,10 @@ class LeaseStorage:
         """Save data to JSON file with lock."""
         with self._lock:
             with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+                # Compact separators: the store is machine-read, and the smaller
+                # file is cheaper to re-read and parse on every _load_data call.
+                # Use `python -m src.storage.lease_storage --pretty` to inspect.
+                json.dump(data, f, separators=(",", ":"), default=str)
 
     def add_lease(self, lease: Lease, lease_id: str) -> None:
         """
@@ -118,7 +128,7 @@ class LeaseStorage:
             return None
             
         try:
-            return Lease.model_validate(entry["full_lease_data"])
+            return _LEASE_ADAPTER.validate_python(entry["full_lease_data"])
         except Exception as e:
             print(f"Error deserializing lease {lease_id}: {e}")
             return None
@@ -167,3 +177,45 @@ class LeaseStorage:
         """Check if a lease exists in storage."""
         data = self._load_data()
         return lease_id in data
+
+    def dump_pretty(self) -> str:
+        """
+        Render the stored data as indented JSON for human inspection.
+        
+        Returns:
+            The full store contents formatted with two-space indentation.
+        """
+        return json.dumps(self._load_data(), indent=2, default=str)
+
+
+def main() -> None:
+    """Command-line entry point for inspecting the lease store."""
+    parser = argparse.ArgumentParser(
+        description="Inspect the Lease Librarian JSON store",
+    )
+    parser.add_argument(
+        "--file", "-f",
+        type=str,
+        default="src/storage/lease_store.json",
+        help="Path to the JSON storage file (default: src/storage/lease_store.json)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Print the store contents as indented JSON",
+    )
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.file):
+        print(f"Error: Storage file does not exist: {args.file}")
+        sys.exit(1)
+    
+    storage = LeaseStorage(storage_file=args.file)
+    if args.pretty:
+        print(storage.dump_pretty())
+    else:
+        print(f"{len(storage.get_all_leases())} leases in {args.file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Lease Digitizer - Numba Kernels for Financial Calculations
+
+float64 kernels for the numeric core of FinancialCalculatorTool. Decimal
+conversion happens in the calculator; these functions only see arrays
+and floats.
+
+When Numba is not installed the kernels are None and callers use their
+NumPy implementation instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the calculator uses NumPy instead
+    njit = None
+
+
+def _npv_f64(cash_flows: np.ndarray, rate: float) -> float:
+    """
+    Discount cash flows in a single loop, the first at period 0.
+    
+    Args:
+        cash_flows: Cash flows by period (float64)
+        rate: Discount rate per period
+        
+    Returns:
+        Net present value
+    """
+    total = 0.0
+    discount = 1.0
+    growth = 1.0 + rate
+    for cash_flow in cash_flows:
+        total += cash_flow / discount
+        discount *= growth
+    return total
+
+
+if njit is not None:
+    # Compiled lazily on first call; cache=True keeps the machine code on
+    # disk so later processes skip compilation
+    npv_f64 = njit(cache=True, fastmath=True)(_npv_f64)
+else:
+    npv_f64 = None
@@ -14,11 +14,25 @@ Key Features:
 """
 
 import re
-from datetime import date, datetime
-from typing import Optional
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Any, Optional, Sequence
 
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.tools.financial_calculator import _add_months
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; find_dates uses the combined regex
+    ahocorasick = None
 
 
 class NormalizedDate(BaseModel):
@@ -39,6 +53,8 @@ class NormalizedDate(BaseModel):
     confidence: float = Field(default=1.0, ge=0, le=1, description="Confidence")
     is_approximate: bool = Field(default=False, description="Is approximate")
     notes: Optional[str] = Field(default=None, description="Parsing notes")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class DateRange(BaseModel):
@@ -53,6 +69,8 @@ class DateRange(BaseModel):
     start_date: date
     end_date: date
     original_text: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # Common date patterns in legal documents
@@ -83,6 +101,174 @@ MONTH_MAP = {
     "december": 12, "dec": 12,
 }
 
+# Case variants as they appear in documents ("March", "MARCH", "march"), so
+# the common case is a single dict probe with no lowercase copy of the token
+_MONTH_LOOKUP = {
+    variant: number
+    for name, number in MONTH_MAP.items()
+    for variant in (name, name.title(), name.upper())
+}
+
+
+def _month_number(token: str) -> int:
+    """Resolve a month name or abbreviation to its month number."""
+    number = _MONTH_LOOKUP.get(token)
+    if number is None:
+        # Mixed-case tokens such as "SePtember" take the slow path
+        number = MONTH_MAP[token.lower()]
+    return number
+
+
+# RE2's \s and \d are ASCII-only, while Python's match any Unicode
+# whitespace (str.isspace) and decimal digit (str.isdecimal). These classes
+# spell out the Python sets so both engines find the same dates
+_RE2_UNICODE_CLASSES = {
+    r"\s": r"[\t-\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}"
+           r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]",
+    r"\d": r"\p{Nd}",
+}
+
+
+def _build_combined_pattern(patterns: list[str]) -> Any:
+    """
+    Union DATE_PATTERNS into one alternation compiled once at import.
+    
+    Each alternative is wrapped in an outer ``p{i}`` group and its inner
+    month/day/year groups are suffixed with ``{i}`` (duplicate group names
+    are illegal). The outer group closes last, so ``match.lastgroup``
+    identifies which pattern matched.
+    
+    When google-re2 is installed the union is compiled as a linear-time
+    automaton, which avoids backtracking on long documents; its whitespace
+    and digit classes are widened to match the stdlib engine. Otherwise,
+    or if RE2 rejects the pattern, the stdlib ``re`` engine is used.
+    """
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        renamed = re.sub(r"\(\?P<(month|day|year)>", rf"(?P<\g<1>{i}>", pattern)
+        alternatives.append(f"(?P<p{i}>{renamed})")
+    combined = "|".join(alternatives)
+    
+    if re2 is not None:
+        try:
+            widened = re.sub(
+                r"\\[sd]", lambda m: _RE2_UNICODE_CLASSES[m.group(0)], combined
+            )
+            return re2.compile(f"(?i){widened}")
+        except re2.error:
+            pass
+    return re.compile(combined, re.IGNORECASE)
+
+
+_COMBINED_DATE_RE = _build_combined_pattern(DATE_PATTERNS)
+
+# Numeric formats only, for find_dates when month names are located by the
+# Aho-Corasick automaton below
+_NUMERIC_DATE_RE = _build_combined_pattern(
+    [DATE_PATTERNS[2], DATE_PATTERNS[3]]
+)
+
+# Day and year following a month name ("January 15, 2024", "Jan. 15, 2024"),
+# matched anchored at the end of the month token
+_MONTH_TAIL_RE = re.compile(r"\s+(\d{1,2}),?\s+(\d{4})")
+_ABBREV_TAIL_RE = re.compile(r"\.?\s+(\d{1,2}),?\s+(\d{4})")
+
+# Ordinal day preceding a month name ("15th day of January, 2024"), matched
+# against a short window ending at the month token, and the year after it
+_ORDINAL_HEAD_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)\s+(?:day\s+of\s+)?\Z", re.IGNORECASE)
+_ORDINAL_TAIL_RE = re.compile(r",?\s+(\d{4})")
+_ORDINAL_WINDOW = 32
+
+
+def _build_month_automaton() -> Any:
+    """
+    Build an Aho-Corasick automaton over the MONTH_MAP keys.
+    
+    The automaton finds every month token in one linear pass regardless of
+    how many names it holds. Each key maps to ``(month, length)``; tokens
+    of length 3 are abbreviations ("may" is both forms).
+    
+    Returns:
+        The automaton, or None when pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for name, number in MONTH_MAP.items():
+        automaton.add_word(name, (number, len(name)))
+    automaton.make_automaton()
+    return automaton
+
+
+_MONTH_AUTOMATON = _build_month_automaton()
+
+# Joins inputs in normalize_batch. It must not be matched by \s or any
+# other token in DATE_PATTERNS, so no match can span two inputs (the ASCII
+# record separator \x1e counts as whitespace for Python's re, NUL does not)
+_BATCH_SEPARATOR = "\x00"
+
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "fifteen": 15, "twenty": 20, "thirty": 30, "forty": 40, "forty-five": 45,
+    "sixty": 60, "ninety": 90, "one hundred twenty": 120,
+}
+
+# All relative-date forms in one alternation, compiled once, so a
+# description is recognized in a single scan rather than by trying a
+# cascade of patterns. Quantities may be digits, words, or "thirty (30)".
+# Bare number words must be a NUMBER_WORDS phrase, tried longest first so
+# "one hundred twenty" is not read as "twenty".
+_NUMBER_WORDS_ALT = "|".join(
+    re.escape(phrase).replace(r"\ ", r"\s+")
+    for phrase in sorted(NUMBER_WORDS, key=len, reverse=True)
+)
+_RELATIVE_DATE_RE = re.compile(
+    r"""
+    (?P<offset>
+        (?:
+            (?P<word>[a-z]+(?:[\s-][a-z]+)*)\s*\((?P<paren>\d+)\)
+            | (?P<digits>\d+)
+            | \b(?P<bare>""" + _NUMBER_WORDS_ALT + r""")
+        )
+        (?:\s+(?P<business>business|working))?
+        \s+(?P<unit>day|month|year)s?
+        \s+(?P<direction>after|following|from|before|prior\s+to)\b
+    )
+    | (?P<boundary>
+        (?P<edge>first|last)\s+day\s+of\s+the\s+(?:calendar\s+)?month
+        (?:\s+(?P<which>following|next|preceding|prior))?
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+def _match_to_date(match: Any) -> date:
+    """
+    Build a date from a match of the combined date pattern.
+    
+    Raises:
+        ValueError: If the matched components are not a valid calendar date
+    """
+    index = match.lastgroup[1:]
+    month_text = match.group(f"month{index}")
+    day = int(match.group(f"day{index}"))
+    year = int(match.group(f"year{index}"))
+    
+    if month_text.isdigit():
+        month = int(month_text)
+    else:
+        month = _month_number(month_text)
+    
+    # Two-digit years (e.g. 1/15/24) are assumed to be in the 2000s
+    if year < 100:
+        year += 2000
+    
+    return date(year, month, day)
+
 
 class DateNormalizerTool(BaseTool):
     """
@@ -126,6 +312,53 @@ class DateNormalizerTool(BaseTool):
         Args:
             date_text: Date text from document
             
+        Returns:
+            NormalizedDate with parsed date and metadata
+        """
+        if not date_text or not date_text.strip():
+            return self._build_result(date_text, None)
+        
+        return self._build_result(date_text, _COMBINED_DATE_RE.search(date_text))
+    
+    def normalize_batch(self, texts: Sequence[str]) -> list[NormalizedDate]:
+        """
+        Normalize many date strings with a single regex scan.
+        
+        Inputs are joined into one buffer and scanned once; each match is
+        assigned back to its input by offset. Results are identical to
+        calling normalize() on each text, without per-call overhead.
+        
+        Args:
+            texts: Date texts, e.g. spans extracted from a document
+            
+        Returns:
+            One NormalizedDate per input, in input order
+        """
+        if not texts:
+            return []
+        
+        buffer = _BATCH_SEPARATOR.join(texts)
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+        
+        first_matches: list[Optional[Any]] = [None] * len(texts)
+        for match in _COMBINED_DATE_RE.finditer(buffer):
+            index = bisect_right(starts, match.start()) - 1
+            if first_matches[index] is None:
+                first_matches[index] = match
+        
+        return [
+            self._build_result(text, match)
+            for text, match in zip(texts, first_matches)
+        ]
+    
+    def _build_result(self, date_text: str, match: Optional[Any]) -> NormalizedDate:
+        """
+        Convert the first date-pattern match in a text into a NormalizedDate.
+        
+        Args:
+            date_text: Original date text
+            match: First match of the combined pattern in the text, if any
+            
         Returns:
             NormalizedDate with parsed date and metadata
         """
@@ -136,14 +369,31 @@ class DateNormalizerTool(BaseTool):
                 notes="Empty date text",
             )
         
-        clean_text = date_text.strip()
+        if match is None:
+            return NormalizedDate(
+                original_text=date_text,
+                confidence=0.0,
+                notes="Unrecognized date format",
+            )
         
-        # TODO: Implement full date parsing
-        # 1. Try each pattern in order
-        # 2. Handle edge cases (leap years, etc.)
-        # 3. Calculate confidence based on match quality
+        try:
+            parsed = _match_to_date(match)
+        except ValueError as e:
+            return NormalizedDate(
+                original_text=date_text,
+                confidence=0.0,
+                notes=f"Invalid date: {e}",
+            )
         
-        raise NotImplementedError("Date normalization not yet implemented")
+        # Lower confidence when the date was embedded in surrounding text
+        exact = match.group(0) == date_text.strip()
+        return NormalizedDate(
+            original_text=date_text,
+            normalized_date=parsed,
+            iso_format=parsed.isoformat(),
+            confidence=1.0 if exact else 0.8,
+            notes=None if exact else "Date extracted from surrounding text",
+        )
     
     def find_dates(self, text: str) -> list[NormalizedDate]:
         """
@@ -155,11 +405,145 @@ class DateNormalizerTool(BaseTool):
         Returns:
             List of normalized dates found
         """
-        # TODO: Implement date finding
-        # 1. Search for all date patterns
-        # 2. Normalize each found date
-        # 3. Remove duplicates
-        raise NotImplementedError("Date finding not yet implemented")
+        lowered = text.lower()
+        if _MONTH_AUTOMATON is None or len(lowered) != len(text):
+            # Lowercasing changed offsets (e.g. "İ"), or no automaton
+            spans = self._scan_dates_regex(text)
+        else:
+            spans = self._merge_numeric_dates(text, self._scan_month_dates(text, lowered))
+        
+        results: list[NormalizedDate] = []
+        seen: set[date] = set()
+        for _, _, original_text, parsed in spans:
+            if parsed is None or parsed in seen:
+                continue
+            seen.add(parsed)
+            
+            results.append(NormalizedDate(
+                original_text=original_text,
+                normalized_date=parsed,
+                iso_format=parsed.isoformat(),
+            ))
+        
+        return results
+    
+    @staticmethod
+    def _scan_dates_regex(
+        text: str,
+        pattern: Any = _COMBINED_DATE_RE,
+    ) -> list[tuple[int, int, str, Optional[date]]]:
+        """
+        Find dates with a combined date pattern.
+        
+        Returns:
+            (start, end, matched text, date) for each match; the date is
+            None when the match is not a valid calendar date
+        """
+        spans = []
+        for match in pattern.finditer(text):
+            try:
+                parsed = _match_to_date(match)
+            except ValueError:
+                parsed = None
+            spans.append((match.start(), match.end(), match.group(0), parsed))
+        return spans
+    
+    @staticmethod
+    def _merge_numeric_dates(
+        text: str,
+        month_spans: list[tuple[int, int, str, Optional[date]]],
+    ) -> list[tuple[int, int, str, Optional[date]]]:
+        """
+        Combine month-name candidates with numeric dates as finditer would.
+        
+        Matches are taken leftmost first and consume their text, even when
+        they are not valid dates, so a candidate overlapping an earlier
+        match is dropped (the ISO date inside "May 30, 2024-01-15"). The
+        numeric pattern is searched again from the end of each accepted
+        match, since a dropped numeric match may hide a later one.
+        
+        Returns:
+            Non-overlapping (start, end, matched text, date) spans in order
+        """
+        month_spans.sort(key=lambda span: span[0])
+        spans = []
+        pos = 0
+        index = 0
+        numeric = _NUMERIC_DATE_RE.search(text)
+        while True:
+            while index < len(month_spans) and month_spans[index][0] < pos:
+                index += 1
+            if numeric is not None and numeric.start() < pos:
+                numeric = _NUMERIC_DATE_RE.search(text, pos)
+            
+            month_span = month_spans[index] if index < len(month_spans) else None
+            if numeric is not None and (month_span is None or numeric.start() < month_span[0]):
+                try:
+                    parsed = _match_to_date(numeric)
+                except ValueError:
+                    parsed = None
+                spans.append((numeric.start(), numeric.end(), numeric.group(0), parsed))
+            elif month_span is not None:
+                spans.append(month_span)
+            else:
+                return spans
+            pos = spans[-1][1]
+    
+    @staticmethod
+    def _scan_month_dates(
+        text: str,
+        lowered: str,
+    ) -> list[tuple[int, int, str, Optional[date]]]:
+        """
+        Find month-name dates by locating month tokens with the automaton.
+        
+        Day and year are matched with small anchored patterns at each
+        token, so only the text around a month name is examined by ``re``.
+        
+        Args:
+            text: Original text
+            lowered: ``text.lower()``, with identical offsets
+            
+        Returns:
+            (start, end, matched text, date) for each candidate; the date
+            is None when it is not a valid calendar date
+        """
+        spans = []
+        for end, (month, length) in _MONTH_AUTOMATON.iter(lowered):
+            after = end + 1
+            token_start = after - length
+            tail_re = _ABBREV_TAIL_RE if length == 3 else _MONTH_TAIL_RE
+            tail = tail_re.match(text, after)
+            if tail is not None:
+                start, stop = token_start, tail.end()
+                day, year = int(tail.group(1)), int(tail.group(2))
+            elif length > 3 or month == 5:
+                # Ordinal form, which only takes full month names
+                head = _ORDINAL_HEAD_RE.search(
+                    text, max(0, token_start - _ORDINAL_WINDOW), token_start
+                )
+                tail = _ORDINAL_TAIL_RE.match(text, after)
+                if head is None or tail is None:
+                    continue
+                start, stop = head.start(), tail.end()
+                day, year = int(head.group(1)), int(tail.group(1))
+                if len(head.group(1)) == 2:
+                    # If the two-digit day overlaps an earlier match, the
+                    # regex would start at the second digit instead
+                    try:
+                        parsed = date(year, month, day % 10)
+                    except ValueError:
+                        parsed = None
+                    spans.append((start + 1, stop, text[start + 1:stop], parsed))
+            else:
+                continue
+            
+            try:
+                parsed = date(year, month, day)
+            except ValueError:
+                parsed = None
+            spans.append((start, stop, text[start:stop], parsed))
+        return spans
     
     def parse_date_range(self, text: str) -> Optional[DateRange]:
         """
@@ -199,8 +583,58 @@ class DateNormalizerTool(BaseTool):
         Returns:
             NormalizedDate with resolved date
         """
-        # TODO: Implement relative date resolution
-        raise NotImplementedError("Relative date resolution not yet implemented")
+        match = _RELATIVE_DATE_RE.search(relative_text or "")
+        if match is None:
+            # Not relative; the text may simply be an absolute date
+            return self.normalize(relative_text)
+        
+        if match.group("boundary"):
+            which = (match.group("which") or "").lower()
+            if which in ("following", "next"):
+                month_shift = 1
+            elif which in ("preceding", "prior"):
+                month_shift = -1
+            else:
+                month_shift = 0
+            first_of_month = _add_months(reference_date.replace(day=1), month_shift)
+            if match.group("edge").lower() == "first":
+                resolved = first_of_month
+            else:
+                resolved = _add_months(first_of_month, 1) - timedelta(days=1)
+        elif match.group("business"):
+            # Needs a holiday calendar; a weekend-only count would be wrong
+            # around holidays, so report rather than guess
+            return NormalizedDate(
+                original_text=relative_text,
+                confidence=0.0,
+                notes="Business-day offsets are not supported",
+            )
+        else:
+            if match.group("paren"):
+                amount = int(match.group("paren"))
+            elif match.group("digits"):
+                amount = int(match.group("digits"))
+            else:
+                amount = NUMBER_WORDS[" ".join(match.group("bare").lower().split())]
+            
+            if match.group("direction").lower().startswith(("before", "prior")):
+                amount = -amount
+            
+            unit = match.group("unit").lower()
+            if unit == "day":
+                resolved = reference_date + timedelta(days=amount)
+            elif unit == "month":
+                resolved = _add_months(reference_date, amount)
+            else:
+                resolved = _add_months(reference_date, amount * 12)
+        
+        return NormalizedDate(
+            original_text=relative_text,
+            normalized_date=resolved,
+            iso_format=resolved.isoformat(),
+            confidence=0.9,
+            notes=f"Resolved relative to {reference_date.isoformat()}",
+        )
     
     def calculate_term_end(
         self,
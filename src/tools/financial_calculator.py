@@ -13,15 +13,32 @@ Key Features:
 - Present value and NPV analysis
 """
 
+import calendar
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 from langchain_core.tools import BaseTool
 from pydantic import Field
 
+from src.tools._financial_numba import npv_f64
+
+
+# Above this many decimal places float64 can no longer be trusted to round
+# correctly, so vectorized paths fall back to exact Decimal arithmetic
+_FLOAT_SAFE_PRECISION = 9
+
+# Decimal constants shared by the hot paths instead of being rebuilt per call
+_DEC_0 = Decimal(0)
+_DEC_1 = Decimal(1)
+_DEC_12 = Decimal(12)
+_DEC_100 = Decimal(100)
+_DEFAULT_TOLERANCE = Decimal("0.01")
+
 
 class EscalationType(str, Enum):
     """Types of rent escalation."""
@@ -30,7 +47,7 @@ class EscalationType(str, Enum):
     CPI = "cpi"
 
 
-@dataclass
+@dataclass(slots=True)
 class RentScheduleItem:
     """
     Single item in a rent schedule.
@@ -49,7 +66,7 @@ class RentScheduleItem:
     rent_psf: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RentSchedule:
     """
     Complete rent schedule over lease term.
@@ -64,7 +81,7 @@ class RentSchedule:
     average_rent: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class ProRataResult:
     """
     Result of pro-rata calculation.
@@ -81,6 +98,44 @@ class ProRataResult:
     prorated_amount: Decimal
 
 
+def _add_months(start: date, months: int) -> date:
+    """Add calendar months to a date, clamping to the last day of the month."""
+    month_index = start.month - 1 + months
+    year = start.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(start.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def _to_decimal(value: Decimal | int | float | str) -> Decimal:
+    """Coerce a number to Decimal, skipping the string round-trip for Decimals."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@lru_cache(maxsize=16)
+def _quantum(precision: int) -> Decimal:
+    """Smallest increment at a given precision, e.g. 0.01 for 2 places."""
+    return _DEC_1.scaleb(-precision)
+
+
+@lru_cache(maxsize=256)
+def _escalation_multiplier(rate: Decimal, periods: int) -> Decimal:
+    """
+    Compound percentage escalation multiplier, computed in Decimal.
+    
+    Cached so that leases in a batch sharing the same rate and period
+    count reuse the result.
+    
+    Args:
+        rate: Escalation percentage (e.g. 3 for 3%)
+        periods: Number of escalation periods
+        
+    Returns:
+        (1 + rate / 100) ** periods
+    """
+    return (_DEC_1 + rate / _DEC_100) ** periods
+
+
 class FinancialCalculatorTool(BaseTool):
     """
     LangChain tool for commercial real estate financial calculations.
@@ -129,10 +184,7 @@ class FinancialCalculatorTool(BaseTool):
     
     def _round(self, value: Decimal) -> Decimal:
         """Round a decimal to configured precision."""
-        return value.quantize(
-            Decimal(10) ** -self.precision,
-            rounding=ROUND_HALF_UP
-        )
+        return value.quantize(_quantum(self.precision), rounding=ROUND_HALF_UP)
     
     def calculate_rent_schedule(
         self,
@@ -140,7 +192,7 @@ class FinancialCalculatorTool(BaseTool):
         start_date: date,
         term_months: int,
         escalation_type: EscalationType = EscalationType.FIXED_PERCENTAGE,
-        escalation_value: Decimal = Decimal("0"),
+        escalation_value: Decimal = _DEC_0,
         escalation_frequency_months: int = 12,
         square_feet: Optional[Decimal] = None,
     ) -> RentSchedule:
@@ -159,13 +211,61 @@ class FinancialCalculatorTool(BaseTool):
         Returns:
             RentSchedule with all periods and totals
         """
-        # TODO: Implement rent schedule calculation
-        # 1. Create initial period
-        # 2. Apply escalations at specified frequency
-        # 3. Handle partial periods
-        # 4. Calculate totals and averages
+        if term_months <= 0:
+            raise ValueError("Term months must be positive")
+        if escalation_frequency_months <= 0:
+            raise ValueError("Escalation frequency must be positive")
+        
+        escalation_type = EscalationType(escalation_type)
+        current_rent = _to_decimal(base_rent)
+        escalation_value = _to_decimal(escalation_value)
+        square_feet = _to_decimal(square_feet) if square_feet else None
         
-        raise NotImplementedError("Rent schedule calculation not yet implemented")
+        # Per-step adjustment is computed once and applied cumulatively,
+        # rather than re-raising the multiplier to the nth power each period
+        if escalation_type == EscalationType.FIXED_PERCENTAGE:
+            multiplier_per_step = _escalation_multiplier(escalation_value, 1)
+        elif escalation_type != EscalationType.FIXED_AMOUNT:
+            raise ValueError(f"Unsupported escalation type: {escalation_type}")
+        
+        items: list[RentScheduleItem] = []
+        total_rent = _DEC_0
+        month_offset = 0
+        
+        while month_offset < term_months:
+            # The final period may be shorter than the escalation frequency
+            period_months = min(escalation_frequency_months, term_months - month_offset)
+            period_start = _add_months(start_date, month_offset)
+            period_end = _add_months(start_date, month_offset + period_months) - timedelta(days=1)
+            
+            monthly_rent = self._round(current_rent)
+            annual_rent = self.calculate_annual_from_monthly(monthly_rent)
+            rent_psf = (
+                self.calculate_rent_per_sqft(annual_rent, square_feet)
+                if square_feet
+                else None
+            )
+            
+            items.append(RentScheduleItem(
+                period_start=period_start,
+                period_end=period_end,
+                monthly_rent=monthly_rent,
+                annual_rent=annual_rent,
+                rent_psf=rent_psf,
+            ))
+            total_rent += monthly_rent * period_months
+            
+            month_offset += period_months
+            if escalation_type == EscalationType.FIXED_PERCENTAGE:
+                current_rent *= multiplier_per_step
+            else:
+                current_rent += escalation_value
+        
+        return RentSchedule(
+            items=items,
+            total_rent=self._round(total_rent),
+            average_rent=self._round(total_rent / term_months),
+        )
     
     def calculate_escalated_rent(
         self,
@@ -185,10 +285,20 @@ class FinancialCalculatorTool(BaseTool):
             
         Returns:
             Escalated rent amount
+            
+        Raises:
+            ValueError: If periods is fractional or the escalation type is
+                unsupported
         """
+        if periods != int(periods):
+            raise ValueError(f"Periods must be a whole number: {periods}")
+        periods = int(periods)
+        current_rent = _to_decimal(current_rent)
+        escalation_value = _to_decimal(escalation_value)
+        
         if escalation_type == EscalationType.FIXED_PERCENTAGE:
-            multiplier = (1 + escalation_value / 100) ** periods
-            return self._round(current_rent * Decimal(str(multiplier)))
+            multiplier = _escalation_multiplier(escalation_value, periods)
+            return self._round(current_rent * multiplier)
         elif escalation_type == EscalationType.FIXED_AMOUNT:
             return self._round(current_rent + (escalation_value * periods))
         else:
@@ -214,9 +324,31 @@ class FinancialCalculatorTool(BaseTool):
             
         Returns:
             ProRataResult with calculation details
+            
+        Raises:
+            ValueError: If the period ends before it starts
         """
-        # TODO: Implement prorate calculation
-        raise NotImplementedError("Prorate calculation not yet implemented")
+        # Day counts use inclusive integer ordinals, avoiding timedelta objects
+        period_start_o = period_start.toordinal()
+        period_end_o = period_end.toordinal()
+        days_in_period = period_end_o - period_start_o + 1
+        if days_in_period <= 0:
+            raise ValueError("Period end must not be before period start")
+        
+        # Overlap of the two ranges; zero when they don't intersect
+        days_applicable = max(
+            0,
+            min(period_end_o, prorate_end.toordinal())
+            - max(period_start_o, prorate_start.toordinal())
+            + 1,
+        )
+        
+        return ProRataResult(
+            full_period_amount=full_amount,
+            days_in_period=days_in_period,
+            days_applicable=days_applicable,
+            prorated_amount=self._round(full_amount * days_applicable / days_in_period),
+        )
     
     def calculate_rent_per_sqft(
         self,
@@ -239,11 +371,11 @@ class FinancialCalculatorTool(BaseTool):
     
     def calculate_annual_from_monthly(self, monthly_rent: Decimal) -> Decimal:
         """Calculate annual rent from monthly."""
-        return self._round(monthly_rent * 12)
+        return self._round(monthly_rent * _DEC_12)
     
     def calculate_monthly_from_annual(self, annual_rent: Decimal) -> Decimal:
         """Calculate monthly rent from annual."""
-        return self._round(annual_rent / 12)
+        return self._round(annual_rent / _DEC_12)
     
     def calculate_cam_share(
         self,
@@ -273,6 +405,12 @@ class FinancialCalculatorTool(BaseTool):
         """
         Calculate Net Present Value of cash flows.
         
+        The first cash flow is treated as occurring at period 0 and is
+        not discounted. Cash flows are discounted in float64 by a Numba
+        kernel when available, otherwise in a single vectorized NumPy
+        pass; precisions beyond what float64 can round reliably use an
+        exact Decimal loop instead.
+        
         Args:
             cash_flows: List of cash flows by period
             discount_rate: Annual discount rate (as decimal, e.g., 0.05 for 5%)
@@ -280,14 +418,38 @@ class FinancialCalculatorTool(BaseTool):
         Returns:
             NPV of cash flows
         """
-        # TODO: Implement NPV calculation
-        raise NotImplementedError("NPV calculation not yet implemented")
+        if discount_rate <= -1:
+            raise ValueError("Discount rate must be greater than -1")
+        
+        if not cash_flows:
+            return self._round(_DEC_0)
+        
+        if self.precision > _FLOAT_SAFE_PRECISION:
+            growth = _DEC_1 + _to_decimal(discount_rate)
+            npv = _DEC_0
+            discount = _DEC_1
+            for cash_flow in cash_flows:
+                npv += _to_decimal(cash_flow) / discount
+                discount *= growth
+            return self._round(npv)
+        
+        flows = np.fromiter(
+            (float(cash_flow) for cash_flow in cash_flows),
+            dtype=np.float64,
+            count=len(cash_flows),
+        )
+        if npv_f64 is not None:
+            npv_float = npv_f64(flows, float(discount_rate))
+        else:
+            discounts = (1.0 + float(discount_rate)) ** np.arange(len(flows))
+            npv_float = float((flows / discounts).sum())
+        return self._round(Decimal(str(npv_float)))
     
     def verify_calculation(
         self,
         stated_value: Decimal,
         calculated_value: Decimal,
-        tolerance_percent: Decimal = Decimal("0.01"),
+        tolerance_percent: Decimal = _DEFAULT_TOLERANCE,
     ) -> tuple[bool, Decimal]:
         """
         Verify a stated value against calculated value.
@@ -12,15 +12,36 @@ Key Features:
 - Memory-efficient streaming for large files
 """
 
-from dataclasses import dataclass
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import BinaryIO, Optional, Union
+from typing import BinaryIO, Iterator, Literal, Optional, Union
 
+import numpy as np
+import pdfplumber
 from langchain_core.tools import BaseTool
 from pydantic import Field
+from pypdf import PdfReader
+from pypdf.errors import PdfReadError
 
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF is optional; pdfplumber/pypdf are used instead
+    pymupdf = None
 
-@dataclass
+PDFBackend = Literal["pymupdf", "pdfplumber", "pypdf"]
+
+# In-memory PDF content accepted without copying
+PDFBuffer = Union[bytes, bytearray, memoryview]
+
+PDFSource = Union[Path, BinaryIO, PDFBuffer]
+
+
+@dataclass(slots=True)
 class PageContent:
     """
     Extracted content from a single PDF page.
@@ -29,7 +50,7 @@ class PageContent:
         page_number: 1-indexed page number
         text: Extracted text content
         char_count: Number of characters
-        has_tables: Whether tables were detected
+        has_tables: Whether tables were detected (only when requested)
         has_images: Whether images were detected
     """
     page_number: int
@@ -39,7 +60,7 @@ class PageContent:
     has_images: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFMetadata:
     """
     Metadata extracted from a PDF document.
@@ -62,27 +83,125 @@ class PDFMetadata:
     file_size_bytes: Optional[int] = None
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class ParsedDocument:
     """
     Complete parsed PDF document.
     
+    Pages are stored column-wise: text in a list and per-page counts and
+    flags in NumPy arrays, so aggregate queries over pages are vectorized
+    and no object is kept per page. Indexing or iterating the document
+    yields PageContent views built on demand.
+    
     Attributes:
         metadata: Document metadata
-        pages: List of page contents
-        full_text: Concatenated text from all pages
+        texts: Extracted text of each page, in page order
+        char_counts: Character count of each page (int32)
+        has_tables: Whether tables were detected on each page (bool)
+        has_images: Whether images were detected on each page (bool)
+        pages: List of page contents (built on access)
+        full_text: Concatenated text from all pages (built on first access)
     """
     metadata: PDFMetadata
-    pages: list[PageContent]
-    full_text: str
+    texts: list[str]
+    char_counts: np.ndarray
+    has_tables: np.ndarray
+    has_images: np.ndarray
+    _full_text: Optional[str] = field(default=None, init=False, repr=False)
+    
+    @classmethod
+    def from_pages(cls, metadata: PDFMetadata, pages: list[PageContent]) -> "ParsedDocument":
+        """
+        Build a document from page records in page order.
+        
+        Args:
+            metadata: Document metadata
+            pages: Extracted pages
+            
+        Returns:
+            ParsedDocument with column storage
+        """
+        return cls(
+            metadata=metadata,
+            texts=[page.text for page in pages],
+            char_counts=np.fromiter(
+                (page.char_count for page in pages), dtype=np.int32, count=len(pages)
+            ),
+            has_tables=np.fromiter(
+                (page.has_tables for page in pages), dtype=np.bool_, count=len(pages)
+            ),
+            has_images=np.fromiter(
+                (page.has_images for page in pages), dtype=np.bool_, count=len(pages)
+            ),
+        )
+    
+    def __len__(self) -> int:
+        """Number of pages."""
+        return len(self.texts)
+    
+    def __getitem__(self, index: int) -> PageContent:
+        """Get a view of a single page by 0-based index."""
+        if index < 0:
+            index += len(self.texts)
+        return PageContent(
+            page_number=index + 1,
+            text=self.texts[index],
+            char_count=int(self.char_counts[index]),
+            has_tables=bool(self.has_tables[index]),
+            has_images=bool(self.has_images[index]),
+        )
+    
+    def __iter__(self) -> Iterator[PageContent]:
+        """Iterate page views in page order."""
+        return (self[index] for index in range(len(self.texts)))
+    
+    @property
+    def pages(self) -> list[PageContent]:
+        """List of page contents synthesized from the column storage."""
+        return list(self)
+    
+    @property
+    def total_chars(self) -> int:
+        """Total characters across all pages."""
+        return int(self.char_counts.sum())
+    
+    @property
+    def table_page_numbers(self) -> list[int]:
+        """1-indexed numbers of pages where tables were detected."""
+        return (np.flatnonzero(self.has_tables) + 1).tolist()
+    
+    @property
+    def full_text(self) -> str:
+        """Concatenated text from all pages, joined once on first access."""
+        if self._full_text is None:
+            self._full_text = "\n\n".join(self.texts)
+        return self._full_text
+
+
+def _extract_page_range(
+    file_path: str,
+    backend: PDFBackend,
+    detect_tables: bool,
+    start: int,
+    stop: int,
+) -> list[PageContent]:
+    """
+    Extract a contiguous range of pages in a worker process.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor. Each worker
+    opens its own handle on the file.
+    """
+    parser = PDFParserTool(backend=backend, detect_tables=detect_tables, max_page_workers=1)
+    return list(parser._iter_pages(Path(file_path), start, stop))
 
 
 class PDFParserTool(BaseTool):
     """
     LangChain tool for parsing PDF documents.
     
-    Uses pypdf and optionally pdfplumber for enhanced extraction.
-    Supports text-based PDFs with planned OCR support for scans.
+    Uses PyMuPDF (MuPDF, implemented in C) when it is installed, and
+    otherwise pdfplumber or pypdf. Supports text-based PDFs with planned
+    OCR support for scans.
     
     Example:
         >>> parser = PDFParserTool()
@@ -96,11 +215,42 @@ class PDFParserTool(BaseTool):
         "Input should be a file path to a PDF document."
     )
     
+    backend: PDFBackend = Field(
+        default="pymupdf",
+        description="Text extraction backend (pymupdf falls back if not installed)"
+    )
+    
     use_pdfplumber: bool = Field(
         default=True,
-        description="Use pdfplumber for enhanced extraction"
+        description="Fall back to pdfplumber rather than pypdf when PyMuPDF is unavailable"
+    )
+    
+    detect_tables: bool = Field(
+        default=False,
+        description=(
+            "Run table detection on every page to fill has_tables. Off by "
+            "default: it costs far more than text extraction. Not supported "
+            "by the pypdf backend."
+        )
     )
     
+    max_page_workers: Optional[int] = Field(
+        default=None,
+        description="Processes for page-parallel extraction (None = CPU count, 1 disables)"
+    )
+    
+    parallel_page_threshold: int = Field(
+        default=50,
+        description="Minimum page count before pages are extracted in parallel"
+    )
+    
+    @property
+    def active_backend(self) -> PDFBackend:
+        """Backend actually used for extraction, after any fallback."""
+        if self.backend == "pymupdf" and pymupdf is None:
+            return "pdfplumber" if self.use_pdfplumber else "pypdf"
+        return self.backend
+    
     def _run(self, file_path: str) -> str:
         """
         Parse a PDF and return extracted text.
@@ -133,50 +283,243 @@ class PDFParserTool(BaseTool):
             FileNotFoundError: If file doesn't exist
             ValueError: If file is not a valid PDF
         """
-        path = Path(file_path)
+        path = self._validate_path(file_path)
+        metadata = self._read_metadata(path, path.name, path.stat().st_size)
         
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {path}")
+        workers = min(self.max_page_workers or os.cpu_count() or 1, metadata.page_count)
+        if workers > 1 and metadata.page_count >= self.parallel_page_threshold:
+            pages = self._extract_pages_parallel(path, metadata.page_count, workers)
+        else:
+            pages = list(self._iter_pages(path))
         
-        if path.suffix.lower() != ".pdf":
-            raise ValueError(f"File is not a PDF: {path}")
+        return ParsedDocument.from_pages(metadata, pages)
+    
+    def iter_pages(self, file_path: Union[str, Path]) -> Iterator[PageContent]:
+        """
+        Lazily extract pages from a PDF document one at a time.
         
-        # TODO: Implement PDF parsing
-        # 1. Open PDF with pypdf/pdfplumber
-        # 2. Extract metadata
-        # 3. Extract text from each page
-        # 4. Detect tables and images
-        # 5. Build ParsedDocument
+        Lets consumers such as chunkers stream through a large document
+        without materializing every page or the concatenated full text.
         
-        raise NotImplementedError("PDF parsing not yet implemented")
+        Args:
+            file_path: Path to the PDF file
+            
+        Returns:
+            Iterator of PageContent in page order
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not a PDF
+        """
+        # Validate eagerly so errors surface here rather than on first next()
+        path = self._validate_path(file_path)
+        return self._iter_pages(path)
     
-    def parse_bytes(self, pdf_bytes: bytes, filename: str) -> ParsedDocument:
+    def parse_bytes(self, pdf_bytes: PDFBuffer, filename: str) -> ParsedDocument:
         """
-        Parse a PDF from bytes.
+        Parse a PDF from an in-memory buffer.
+        
+        PyMuPDF reads the buffer in place. The other backends wrap it in
+        BytesIO, which shares rather than copies a ``bytes`` object.
         
         Args:
-            pdf_bytes: PDF file content as bytes
+            pdf_bytes: PDF file content as bytes, bytearray or memoryview
             filename: Original filename for metadata
             
         Returns:
             ParsedDocument with metadata and page contents
         """
-        # TODO: Implement bytes-based parsing
-        raise NotImplementedError("Bytes parsing not yet implemented")
+        if self.active_backend == "pymupdf":
+            metadata = self._read_metadata(pdf_bytes, filename, memoryview(pdf_bytes).nbytes)
+            return ParsedDocument.from_pages(metadata, list(self._iter_pages(pdf_bytes)))
+        
+        return self.parse_stream(io.BytesIO(pdf_bytes), filename)
     
     def parse_stream(self, stream: BinaryIO, filename: str) -> ParsedDocument:
         """
         Parse a PDF from a file stream.
         
         Args:
-            stream: File-like object containing PDF
+            stream: Seekable file-like object containing PDF
             filename: Original filename for metadata
             
         Returns:
             ParsedDocument with metadata and page contents
         """
-        # TODO: Implement stream-based parsing
-        raise NotImplementedError("Stream parsing not yet implemented")
+        file_size = stream.seek(0, io.SEEK_END)
+        stream.seek(0)
+        metadata = self._read_metadata(stream, filename, file_size)
+        
+        stream.seek(0)
+        return ParsedDocument.from_pages(metadata, list(self._iter_pages(stream)))
+    
+    def _validate_path(self, file_path: Union[str, Path]) -> Path:
+        """
+        Check that a path points to an existing PDF file.
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not a PDF
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"PDF file not found: {path}")
+        
+        if path.suffix.lower() != ".pdf":
+            raise ValueError(f"File is not a PDF: {path}")
+        
+        return path
+    
+    def _read_metadata(
+        self,
+        source: PDFSource,
+        filename: str,
+        file_size: Optional[int],
+    ) -> PDFMetadata:
+        """
+        Read document-level metadata.
+        
+        Raises:
+            ValueError: If the source is not a valid PDF
+        """
+        if self.active_backend == "pymupdf":
+            with self._open_pymupdf(source, filename) as doc:
+                info = doc.metadata or {}
+                return PDFMetadata(
+                    filename=filename,
+                    page_count=doc.page_count,
+                    author=info.get("author") or None,
+                    title=info.get("title") or None,
+                    creation_date=info.get("creationDate") or None,
+                    modification_date=info.get("modDate") or None,
+                    file_size_bytes=file_size,
+                )
+        
+        try:
+            with self._open_pypdf(source) as reader:
+                info = reader.metadata
+                page_count = len(reader.pages)
+        except PdfReadError as e:
+            raise ValueError(f"Invalid PDF {filename}: {e}") from e
+        
+        return PDFMetadata(
+            filename=filename,
+            page_count=page_count,
+            author=info.author if info else None,
+            title=info.title if info else None,
+            creation_date=info.get("/CreationDate") if info else None,
+            modification_date=info.get("/ModDate") if info else None,
+            file_size_bytes=file_size,
+        )
+    
+    @staticmethod
+    def _open_pymupdf(source: PDFSource, filename: str) -> "pymupdf.Document":
+        """
+        Open a path, buffer or binary stream with PyMuPDF.
+        
+        Raises:
+            ValueError: If the source is not a valid PDF
+        """
+        try:
+            if isinstance(source, Path):
+                return pymupdf.open(source, filetype="pdf")
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                return pymupdf.open(stream=source, filetype="pdf")
+            return pymupdf.open(stream=source.read(), filetype="pdf")
+        except (pymupdf.FileDataError, RuntimeError) as e:
+            raise ValueError(f"Invalid PDF {filename}: {e}") from e
+    
+    @staticmethod
+    @contextmanager
+    def _open_pypdf(source: PDFSource) -> Iterator[PdfReader]:
+        """
+        Open a path or binary stream with pypdf.
+        
+        pypdf copies a file given by path fully into memory. Files are
+        memory-mapped instead, so the OS pages content in on demand and
+        can share it between readers of the same file.
+        """
+        if isinstance(source, Path) and source.stat().st_size > 0:
+            with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield PdfReader(mm, strict=False)
+        else:
+            yield PdfReader(source, strict=False)
+    
+    def _extract_pages_parallel(
+        self,
+        path: Path,
+        page_count: int,
+        workers: int,
+    ) -> list[PageContent]:
+        """
+        Extract pages of a large PDF across worker processes.
+        
+        pdfplumber and pypdf are pure Python and hold the GIL, so pages are
+        split into one contiguous range per process rather than dispatched
+        to threads. Results are reassembled in page order.
+        """
+        chunk_size = -(-page_count // workers)
+        starts = list(range(0, page_count, chunk_size))
+        stops = [min(start + chunk_size, page_count) for start in starts]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_page_range,
+                [str(path)] * len(starts),
+                [self.active_backend] * len(starts),
+                [self.detect_tables] * len(starts),
+                starts,
+                stops,
+            )
+            return [page for chunk in chunks for page in chunk]
+    
+    def _iter_pages(
+        self,
+        source: PDFSource,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[PageContent]:
+        """Yield PageContent for pages [start, stop) of an opened PDF source."""
+        backend = self.active_backend
+        if backend == "pymupdf":
+            with self._open_pymupdf(source, getattr(source, "name", "buffer")) as doc:
+                stop = doc.page_count if stop is None else stop
+                for index in range(start, stop):
+                    page = doc[index]
+                    text = page.get_text("text")
+                    yield PageContent(
+                        page_number=index + 1,
+                        text=text,
+                        char_count=len(text),
+                        has_tables=self.detect_tables and bool(page.find_tables().tables),
+                        has_images=bool(page.get_images()),
+                    )
+        elif backend == "pdfplumber":
+            with pdfplumber.open(source) as pdf:
+                for index, page in enumerate(pdf.pages[start:stop], start=start):
+                    text = page.extract_text() or ""
+                    yield PageContent(
+                        page_number=index + 1,
+                        text=text,
+                        char_count=len(text),
+                        has_tables=self.detect_tables and bool(page.find_tables()),
+                        has_images=bool(page.images),
+                    )
+                    # Release pdfminer layout objects as we go
+                    page.close()
+        else:
+            with self._open_pypdf(source) as reader:
+                stop = len(reader.pages) if stop is None else stop
+                for index in range(start, stop):
+                    page = reader.pages[index]
+                    text = page.extract_text() or ""
+                    yield PageContent(
+                        page_number=index + 1,
+                        text=text,
+                        char_count=len(text),
+                        has_images=bool(page.images),
+                    )
     
     def extract_text_with_layout(self, file_path: Union[str, Path]) -> str:
         """
@@ -211,4 +554,3 @@ class PDFParserTool(BaseTool):
 # TODO: Add support for password-protected PDFs
 # TODO: Add smart chunking for large documents
 # TODO: Add caching for repeated parsing of same file
-# TODO: Add parallel page processing for large PDFs
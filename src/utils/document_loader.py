@@ -12,11 +12,121 @@ Key Features:
 - Support for multiple file formats
 """
 
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator, Optional, Union
 
 from src.config import get_settings
-from src.tools.pdf_parser import ParsedDocument, PDFParserTool
+from src.tools.pdf_parser import ParsedDocument, PDFBackend, PDFParserTool
+
+# Bump when parser output changes so stale cache entries are ignored
+_CACHE_VERSION = 3
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _default_ext_set() -> frozenset[str]:
+    """
+    Normalized extensions from settings, computed once per process.
+    
+    Call `_default_ext_set.cache_clear()` after `get_settings.cache_clear()`
+    if the supported file types change.
+    """
+    return frozenset(
+        ext.lower().lstrip(".") for ext in get_settings().supported_extensions
+    )
+
+
+def _extension(name: str) -> str:
+    """
+    Lowercased extension of a file name, without the dot.
+    
+    Follows os.path.splitext, so dotfiles such as ".pdf" and bare names
+    such as "pdf" have no extension.
+    """
+    return os.path.splitext(name)[1][1:].lower()
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_parse(
+    parser: PDFParserTool,
+    path: Path,
+    cache_dir: Optional[Path],
+) -> ParsedDocument:
+    """
+    Parse a PDF, reusing a previous result for identical file contents.
+    
+    Entries are keyed by content hash, extraction backend, table detection
+    and cache version, so renamed or copied files still hit. Unreadable
+    entries are treated as misses, and a cache that cannot be written to
+    never fails the parse. Only point cache_dir at a trusted location,
+    since entries are unpickled.
+    """
+    if cache_dir is None:
+        return parser.parse(path)
+    
+    backend = parser.active_backend
+    if parser.detect_tables:
+        backend += "-tables"
+    cache_file = cache_dir / f"{_file_digest(path)}-{backend}-v{_CACHE_VERSION}.pkl"
+    
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                document = pickle.load(f)
+            document.metadata.filename = path.name
+            return document
+        except Exception:
+            # Corrupt, truncated or incompatible entries are all misses
+            pass
+    
+    document = parser.parse(path)
+    
+    # Write then rename so concurrent workers never read a partial entry
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(document, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+    except (OSError, pickle.PicklingError):
+        # Read-only or full cache directories just skip caching
+        pass
+    
+    return document
+
+
+def _parse_pdf(
+    file_path: str,
+    backend: PDFBackend,
+    cache_dir: Optional[Path],
+) -> ParsedDocument:
+    """
+    Parse a single PDF in a worker process.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor; each call
+    builds its own parser since tool instances are not shared across
+    processes. Page-level parallelism is disabled because the batch is
+    already spread across processes.
+    """
+    parser = PDFParserTool(backend=backend, max_page_workers=1)
+    return _cached_parse(parser, Path(file_path), cache_dir)
 
 
 class DocumentLoader:
@@ -36,6 +146,7 @@ class DocumentLoader:
         self,
         supported_extensions: Optional[list[str]] = None,
         max_file_size_mb: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> None:
         """
         Initialize the document loader.
@@ -43,13 +154,22 @@ class DocumentLoader:
         Args:
             supported_extensions: List of supported file extensions
             max_file_size_mb: Maximum file size in MB
+            cache_dir: Directory for caching parsed documents by content
+                hash (caching is disabled when None)
         """
         settings = get_settings()
         self.supported_extensions = supported_extensions or settings.supported_extensions
+        self._ext_set = (
+            frozenset(ext.lower().lstrip(".") for ext in supported_extensions)
+            if supported_extensions
+            else _default_ext_set()
+        )
         self.max_file_size_bytes = (
             (max_file_size_mb or settings.max_document_size_mb) * 1024 * 1024
         )
         
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        
         # Initialize tools
         self._pdf_parser = PDFParserTool()
     
@@ -69,8 +189,8 @@ class DocumentLoader:
         if not file_path.is_file():
             return False, f"Not a file: {file_path}"
         
-        extension = file_path.suffix.lower().lstrip(".")
-        if extension not in self.supported_extensions:
+        extension = _extension(file_path.name)
+        if extension not in self._ext_set:
             return False, f"Unsupported extension: {extension}"
         
         file_size = file_path.stat().st_size
@@ -93,30 +213,72 @@ class DocumentLoader:
             ValueError: If file is invalid or unsupported
         """
         path = Path(file_path)
+        self._check_loadable(path)
+        return _cached_parse(self._pdf_parser, path, self.cache_dir)
+    
+    def _check_loadable(self, path: Path) -> None:
+        """
+        Ensure a file is valid and of a type this loader can parse.
+        
+        Raises:
+            ValueError: If file is invalid or unsupported
+            NotImplementedError: If the file type has no parser yet
+        """
         is_valid, error = self.validate_file(path)
         
         if not is_valid:
             raise ValueError(error)
         
-        extension = path.suffix.lower().lstrip(".")
+        extension = _extension(path.name)
         
-        if extension == "pdf":
-            return self._pdf_parser.parse(path)
-        else:
+        if extension != "pdf":
             # TODO: Add support for other file types
             raise NotImplementedError(f"Loading {extension} files not yet implemented")
     
+    def _iter_candidates(self, dir_path: Path, recursive: bool) -> Iterator[os.DirEntry]:
+        """
+        Yield directory entries for files with a supported extension.
+        
+        Walks with os.scandir and filters on the entry name before any
+        stat call or Path construction, so unrelated files cost almost
+        nothing. Symlinked directories are not descended into, and
+        directories that cannot be read are skipped.
+        """
+        stack = [str(dir_path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    
+                    if _extension(entry.name) in self._ext_set and entry.is_file():
+                        yield entry
+    
     def load_directory(
         self,
         directory_path: Union[str, Path],
         recursive: bool = False,
+        parallel: bool = True,
+        max_workers: Optional[int] = None,
     ) -> Iterator[tuple[Path, ParsedDocument | Exception]]:
         """
         Load all documents from a directory.
         
+        PDF parsing is CPU-bound, so by default files are parsed in a
+        process pool and yielded as they complete (not in directory order).
+        
         Args:
             directory_path: Path to directory
             recursive: Whether to search subdirectories
+            parallel: Parse files concurrently in worker processes
+            max_workers: Worker process count (defaults to CPU count)
             
         Yields:
             Tuples of (file_path, ParsedDocument or Exception)
@@ -126,21 +288,40 @@ class DocumentLoader:
         if not dir_path.exists() or not dir_path.is_dir():
             raise ValueError(f"Invalid directory: {dir_path}")
         
-        pattern = "**/*" if recursive else "*"
+        candidates = [
+            Path(entry.path) for entry in self._iter_candidates(dir_path, recursive)
+        ]
         
-        for file_path in dir_path.glob(pattern):
-            if not file_path.is_file():
-                continue
-            
-            extension = file_path.suffix.lower().lstrip(".")
-            if extension not in self.supported_extensions:
-                continue
+        # A pool is not worth spawning for a single file
+        if not parallel or len(candidates) < 2:
+            for file_path in candidates:
+                try:
+                    document = self.load_file(file_path)
+                    yield file_path, document
+                except Exception as e:
+                    yield file_path, e
+            return
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for file_path in candidates:
+                try:
+                    self._check_loadable(file_path)
+                except Exception as e:
+                    yield file_path, e
+                    continue
+                
+                future = executor.submit(
+                    _parse_pdf,
+                    str(file_path),
+                    self._pdf_parser.active_backend,
+                    self.cache_dir,
+                )
+                futures[future] = file_path
             
-            try:
-                document = self.load_file(file_path)
-                yield file_path, document
-            except Exception as e:
-                yield file_path, e
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], error if error is not None else future.result()
     
     def get_file_list(
         self,
@@ -160,21 +341,15 @@ class DocumentLoader:
         dir_path = Path(directory_path)
         files = []
         
-        pattern = "**/*" if recursive else "*"
-        
-        for file_path in dir_path.glob(pattern):
-            if not file_path.is_file():
-                continue
-            
-            is_valid, _ = self.validate_file(file_path)
-            if is_valid:
-                files.append(file_path)
+        # Extension and file checks are done by the scan; only size remains
+        for entry in self._iter_candidates(dir_path, recursive):
+            if entry.stat().st_size <= self.max_file_size_bytes:
+                files.append(Path(entry.path))
         
         return sorted(files)
 
 
 # TODO: Add async loading support
 # TODO: Add progress tracking for batch operations
-# TODO: Add document caching
 # TODO: Add support for cloud storage (S3, GCS, Azure Blob)
 # TODO: Add document deduplication
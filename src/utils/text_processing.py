@@ -13,8 +13,90 @@ Key Features:
 - Keyword extraction
 """
 
+import io
+import os
 import re
-from typing import Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Optional, Sequence
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keywords are searched one by one
+    ahocorasick = None
+
+
+# Whitespace normalization patterns, compiled once. Tabs are turned into
+# spaces with str.replace first, so runs are a literal-space pattern that
+# never matches the single spaces between words.
+_RE_MULTI_SPACE = re.compile(r" {2,}")
+_RE_BLANKS = re.compile(r"\n{3,}")
+
+# Texts longer than this are cleaned in chunks of about this many characters,
+# so intermediate copies are bounded by the chunk rather than the document
+_CLEAN_CHUNK_CHARS = 1 << 20
+
+# Longer texts are cleaned without memoizing, to bound the cache's memory
+_CLEAN_CACHE_MAX_CHARS = 1 << 20
+
+# Rough characters-per-token ratio for English legal text
+_CHARS_PER_TOKEN = 4
+
+# All three defined-term forms in one alternation, so a document is scanned
+# once: '"Landlord" means ...', '("Base Rent")' / '(the "Lease")', and
+# 'the term "Premises" shall mean ...'. Straight and curly quotes are accepted.
+_DEFINED_RE = re.compile(
+    r"""
+    the\s+term\s+["\u201c](?P<term_shall>[A-Z][A-Za-z ]+)["\u201d]\s+shall\s+mean\s+
+        (?P<def_shall>.+?)(?=[.;](?:\s|$)|\Z)
+    | ["\u201c](?P<term_means>[A-Z][A-Za-z ]+)["\u201d]\s+means\s+
+        (?P<def_means>.+?)(?=[.;](?:\s|$)|\Z)
+    | \((?:the\s+)?["\u201c](?P<term_paren>[A-Z][A-Za-z ]+)["\u201d]\)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Dollar amounts such as "$1,000.00", "$ 1000" or "$50,000"; the amount
+# group never ends in a comma, so "$500, payable" yields "$500"
+_MONEY_RE = re.compile(r"\$\s?(\d(?:[\d,]*\d)?(?:\.\d+)?)")
+
+# Characters of context kept on each side of a keyword
+_KEYWORD_CONTEXT_CHARS = 40
+
+# How far back a parenthetical definition looks for the phrase it names.
+# The phrase also never reaches past the previous definition, a clause
+# break or "by and between", and drops a leading ", and".
+_DEFINED_CONTEXT_CHARS = 300
+_RE_CLAUSE_BREAK = re.compile(r"[.;:]\s|\n\s*\n|\bby\s+and\s+between\s", re.IGNORECASE)
+_RE_LEADING_CONNECTOR = re.compile(r"^[\s,]*(?:(?:and|or)\s+)?", re.IGNORECASE)
+
+# Party roles and the two ways leases introduce them, in one alternation:
+# a labelled line ("LANDLORD: ABC Properties LLC") or a name followed by
+# an optional description and a role parenthetical ('XYZ Corporation, a
+# California corporation ("Tenant")'). A name starts at a word boundary
+# and is capped at eight words: unbounded, every start inside a long
+# ALL-CAPS paragraph would rescan to the paragraph's end (quadratic).
+_PARTY_ROLES = r"Landlord|Tenant|Lessor|Lessee|Sublandlord|Subtenant|Guarantor"
+_PARTY_RE = re.compile(
+    rf"""
+    ^[ \t]*(?P<label>(?i:{_PARTY_ROLES}))[ \t]*:[ \t]*(?P<labelled>[^,\n]+)
+    | (?P<named>\b[A-Z][\w&.'-]*(?:[ \t]+(?:[A-Z][\w&.'-]*|of|and|&)){{0,7}})
+        ,?\s+(?:an?\s[^()"\u201c]{{0,120}}?)?
+        \(\s*(?:the\s+)?["\u201c](?P<role>{_PARTY_ROLES})["\u201d]\s*\)
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# A line break not followed by another, where a chunk can end without
+# splitting a run of spaces or line breaks
+_RE_CHUNK_CUT = re.compile(r"\n(?![\r\n])")
 
 
 class TextProcessor:
@@ -29,26 +111,67 @@ class TextProcessor:
         >>> sections = processor.split_sections(clean_text)
     """
     
-    # Common OCR errors and corrections
+    # Letters OCR commonly reads in place of digits. Only corrected inside
+    # numeric tokens ("1O,OOO", "$l,25O.OO", "2O24"), i.e. tokens holding
+    # a digit and nothing but digits, look-alikes and number punctuation,
+    # so ordinary words ("return", "clause", "I", "O") are never changed.
     OCR_CORRECTIONS = {
-        r"\bl\b": "I",  # Lowercase L often confused with I
-        r"\bO\b": "0",  # Letter O often confused with zero
-        r"rn": "m",     # rn often confused with m
-        r"cl": "d",     # cl often confused with d
+        "O": "0",  # Letter O often confused with zero
+        "o": "0",
+        "l": "1",  # Lowercase L often confused with one
+        "I": "1",
     }
     
-    # Section header patterns
+    # Section header patterns, each matching one whole line (whitespace is
+    # [ \t] rather than \s so a header never runs onto the next line). The
+    # all-caps form only allows trailing spaces after a colon: written as
+    # "[A-Z \t]{3,}:?[ \t]*" two adjacent quantifiers could split the same
+    # run of spaces, which backtracks quadratically in the stdlib engine.
     SECTION_PATTERNS = [
-        r"^(?:ARTICLE|Article)\s+[IVXLC\d]+[:\.]?\s*(.+)$",
-        r"^(?:Section|SECTION)\s+[\d.]+[:\.]?\s*(.+)$",
-        r"^\d+\.\s+(.+)$",
-        r"^[A-Z][A-Z\s]{3,}:?\s*$",
+        r"^(?:ARTICLE|Article)[ \t]+[IVXLC\d]+[:\.]?[ \t]*(.+)$",
+        r"^(?:Section|SECTION)[ \t]+[\d.]+[:\.]?[ \t]*(.+)$",
+        r"^\d+\.[ \t]+(.+)$",
+        r"^[A-Z][A-Z \t]{3,}(?::[ \t]*)?$",
+    ]
+    
+    # Keywords searched by extract_keywords when no list is given
+    LEASE_KEYWORDS = [
+        "base rent",
+        "additional rent",
+        "security deposit",
+        "commencement date",
+        "expiration date",
+        "renewal",
+        "termination",
+        "escalation",
+        "operating expenses",
+        "common area maintenance",
+        "assignment",
+        "sublease",
+        "holdover",
+        "indemnification",
+        "insurance",
+        "permitted use",
     ]
     
+    # Context-free character fixes, applied with str.translate before the
+    # numeric corrections (ligature glyphs left in extracted text)
+    CHAR_SWAPS = {
+        "\ufb00": "ff",
+        "\ufb01": "fi",
+        "\ufb02": "fl",
+        "\ufb03": "ffi",
+        "\ufb04": "ffl",
+    }
+    _CHAR_TABLE = str.maketrans(CHAR_SWAPS)
+    
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize document text.
         
+        Results for texts up to 1M characters are memoized, since the same
+        lease is typically cleaned by several agents in one run.
+        
         Args:
             text: Raw text from document
             
@@ -65,27 +188,60 @@ class TextProcessor:
         # 4. Remove control characters
         
         # Basic whitespace normalization
-        text = re.sub(r"\r\n", "\n", text)
-        text = re.sub(r"\r", "\n", text)
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        if len(text) > _CLEAN_CACHE_MAX_CHARS:
+            return clean_whitespace(text)
+        return _clean_text_cached(text)
+    
+    def clean_text_batch(
+        self,
+        texts: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Clean many documents in parallel worker processes.
+        
+        Cleaning is CPU-bound regex work that holds the GIL, so documents
+        are spread across processes, several per task to amortize IPC.
         
-        return text.strip()
+        Args:
+            texts: Raw texts, e.g. one per document in a corpus
+            max_workers: Worker process count (defaults to CPU count)
+            
+        Returns:
+            Cleaned texts, in input order
+        """
+        workers = max_workers or os.cpu_count() or 1
+        
+        # A pool is not worth spawning for a single document or worker
+        if workers == 1 or len(texts) < 2:
+            return [self.clean_text(text) for text in texts]
+        
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.clean_text, texts, chunksize=chunksize))
     
     def fix_ocr_errors(self, text: str) -> str:
         """
         Apply common OCR error corrections.
         
+        Expands ligature glyphs, and replaces letters misread for digits
+        inside numeric tokens. Words are left unchanged: letter confusions
+        such as "rn" read for "m" cannot be told apart from real words
+        ("return", "clause") without a dictionary, so they are not
+        corrected.
+        
         Args:
             text: Text with potential OCR errors
             
         Returns:
             Text with corrections applied
         """
-        # TODO: Implement OCR correction
-        # This is a placeholder - real implementation needs
-        # context-aware corrections and dictionary validation
-        raise NotImplementedError("OCR correction not yet implemented")
+        if not text:
+            return ""
+        
+        text = text.translate(self._CHAR_TABLE)
+        pattern, table = _ocr_corrector(tuple(self.OCR_CORRECTIONS.items()))
+        return pattern.sub(lambda match: match.group().translate(table), text)
     
     def normalize_legal_text(self, text: str) -> str:
         """
@@ -116,11 +272,24 @@ class TextProcessor:
         Returns:
             List of (section_header, section_content) tuples
         """
-        # TODO: Implement section splitting
-        # 1. Identify section headers
-        # 2. Extract content between headers
-        # 3. Handle nested sections
-        raise NotImplementedError("Section splitting not yet implemented")
+        # TODO: Handle nested sections
+        sections: list[tuple[str, str]] = []
+        headers = list(self._SECTION_RE.finditer(text))
+        
+        # Text before the first header is kept under an empty header
+        preamble = text[:headers[0].start() if headers else len(text)].strip()
+        if preamble:
+            sections.append(("", preamble))
+        
+        # One forward sweep: each section ends where the next header starts
+        ends = [header.start() for header in headers[1:]]
+        ends.append(len(text))
+        sections.extend(
+            (header.group(0).strip(), text[header.end():end].strip())
+            for header, end in zip(headers, ends)
+        )
+        
+        return sections
     
     def extract_keywords(
         self,
@@ -137,8 +306,19 @@ class TextProcessor:
         Returns:
             Dictionary mapping keywords to contexts found
         """
-        # TODO: Implement keyword extraction
-        raise NotImplementedError("Keyword extraction not yet implemented")
+        keywords = [kw for kw in (keyword_list or self.LEASE_KEYWORDS) if kw]
+        lowered = text.lower()
+        if ahocorasick is None or len(lowered) != len(text):
+            # Lowercasing changed offsets (e.g. "İ"), or no automaton
+            spans = _keyword_spans_regex(text, keywords)
+        else:
+            spans = _keyword_spans_automaton(text, lowered, keywords)
+        
+        contexts: dict[str, list[str]] = {}
+        for keyword, start, end in spans:
+            window = text[max(0, start - _KEYWORD_CONTEXT_CHARS):end + _KEYWORD_CONTEXT_CHARS]
+            contexts.setdefault(keyword, []).append(" ".join(window.split()))
+        return contexts
     
     def find_defined_terms(self, text: str) -> dict[str, str]:
         """
@@ -150,12 +330,29 @@ class TextProcessor:
         Returns:
             Dictionary mapping term to definition
         """
-        # TODO: Implement defined term extraction
-        # Look for patterns like:
-        # - "Landlord" means...
-        # - ("Base Rent")
-        # - the term "Premises" shall mean...
-        raise NotImplementedError("Defined term extraction not yet implemented")
+        terms: dict[str, str] = {}
+        previous_end = 0
+        for match in _DEFINED_RE.finditer(text):
+            if match.group("term_paren"):
+                # '... Agreement ("Lease")' names the phrase before it, back
+                # to the start of the clause or the previous definition
+                term = match.group("term_paren")
+                window_start = max(previous_end, match.start() - _DEFINED_CONTEXT_CHARS)
+                context = text[window_start:match.start()]
+                breaks = list(_RE_CLAUSE_BREAK.finditer(context))
+                definition = context[breaks[-1].end():] if breaks else context
+                definition = definition[_RE_LEADING_CONNECTOR.match(definition).end():]
+            elif match.group("term_means"):
+                term, definition = match.group("term_means"), match.group("def_means")
+            else:
+                term, definition = match.group("term_shall"), match.group("def_shall")
+            
+            # The first definition of a term wins
+            if term not in terms:
+                terms[term] = " ".join(definition.split())
+            previous_end = match.end()
+        
+        return terms
     
     def extract_party_names(self, text: str) -> dict[str, list[str]]:
         """
@@ -167,8 +364,20 @@ class TextProcessor:
         Returns:
             Dictionary mapping role to list of names
         """
-        # TODO: Implement party extraction
-        raise NotImplementedError("Party extraction not yet implemented")
+        # TODO: Handle parties introduced without a role label
+        parties: dict[str, list[str]] = {}
+        for match in _PARTY_RE.finditer(text):
+            if match.group("label"):
+                role, name = match.group("label").title(), match.group("labelled")
+            else:
+                role, name = match.group("role"), match.group("named")
+            
+            name = " ".join(name.split())
+            names = parties.setdefault(role, [])
+            if name not in names:
+                names.append(name)
+        
+        return parties
     
     def truncate_for_context(
         self,
@@ -179,6 +388,12 @@ class TextProcessor:
         """
         Truncate text to fit within token limit.
         
+        Tokens are estimated from character counts. With section
+        preservation, the longest run of leading whole sections that fits
+        is kept, found by binary search over cumulative section sizes;
+        otherwise, or if not even the first section fits, the text is cut
+        at the last word boundary within the budget.
+        
         Args:
             text: Full document text
             max_tokens: Maximum tokens allowed
@@ -187,11 +402,155 @@ class TextProcessor:
         Returns:
             Truncated text
         """
-        # TODO: Implement smart truncation
-        # 1. Estimate token count
-        # 2. Identify important sections
-        # 3. Truncate while preserving structure
-        raise NotImplementedError("Smart truncation not yet implemented")
+        # TODO: Prefer important sections over document order
+        if max_tokens <= 0:
+            return ""
+        if _approx_tokens(text) <= max_tokens:
+            return text
+        
+        if preserve_sections:
+            blocks = [
+                f"{header}\n{content}" if header else content
+                for header, content in self.split_sections(text)
+            ]
+            # Each block is followed by a "\n\n" separator in the output
+            totals = list(accumulate(_approx_tokens(block) + 1 for block in blocks))
+            fitting = bisect_right(totals, max_tokens)
+            if fitting:
+                return "\n\n".join(blocks[:fitting])
+        
+        limit = max_tokens * _CHARS_PER_TOKEN
+        cut = text.rfind(" ", 0, limit + 1)
+        return text[:cut if cut > 0 else limit].rstrip()
+
+
+@lru_cache(maxsize=256)
+def _clean_text_cached(text: str) -> str:
+    """Memoized TextProcessor.clean_text for texts up to _CLEAN_CACHE_MAX_CHARS."""
+    return clean_whitespace(text)
+
+
+@lru_cache(maxsize=8)
+def _ocr_corrector(corrections: tuple[tuple[str, str], ...]) -> tuple[re.Pattern, dict[int, str]]:
+    """
+    Compile the numeric-token pattern and translation table for a
+    TextProcessor.OCR_CORRECTIONS table.
+    
+    Memoized on the table's items, so a table extended on the class or an
+    instance takes effect on the next call. Numeric tokens are an optional
+    "$", digit/look-alike groups separated by "." or ",", and an optional
+    "%", with at least one real digit and no word character either side.
+    """
+    lookalikes = re.escape("".join(letter for letter, _ in corrections))
+    pattern = re.compile(
+        rf"(?<![\w.,$])\$?(?=[{lookalikes}.,]*\d)"
+        rf"[\d{lookalikes}]+(?:[.,][\d{lookalikes}]+)*%?(?!\w)"
+    )
+    return pattern, str.maketrans(dict(corrections))
+
+
+def _approx_tokens(text: str) -> int:
+    """Estimate the token count of a text from its length."""
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character continues a word, as ``\\w`` would match it."""
+    return char.isalnum() or char == "_"
+
+
+def _keyword_spans_automaton(
+    text: str,
+    lowered: str,
+    keywords: list[str],
+) -> list[tuple[str, int, int]]:
+    """
+    Find whole-word keyword occurrences with an Aho-Corasick automaton.
+    
+    All keywords are found in one linear pass over the lowercased text,
+    however many there are. The automaton is built once per distinct
+    keyword set and reused across documents.
+    
+    Args:
+        text: Original text
+        lowered: ``text.lower()``, with identical offsets
+        keywords: Keywords to find, matched case-insensitively
+        
+    Returns:
+        (keyword, start, end) for each occurrence, ordered by end offset
+        and then by start
+    """
+    automaton = _keyword_automaton(tuple(sorted(keywords)))
+    
+    spans = []
+    for last, (keyword, length) in automaton.iter(lowered):
+        start, end = last + 1 - length, last + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        spans.append((keyword, start, end))
+    return spans
+
+
+@lru_cache(maxsize=16)
+def _keyword_automaton(keywords: tuple[str, ...]) -> Any:
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+    
+    Each keyword maps to ``(keyword, length)``. Memoized on the sorted
+    keyword tuple, so batches reusing a list build it only once.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), (keyword, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_spans_regex(text: str, keywords: list[str]) -> list[tuple[str, int, int]]:
+    """
+    Find whole-word keyword occurrences with one regex search per keyword.
+    
+    Fallback for _keyword_spans_automaton; returns the same spans.
+    """
+    spans = []
+    for keyword in keywords:
+        pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)", re.IGNORECASE)
+        spans.extend((keyword, m.start(), m.end()) for m in pattern.finditer(text))
+    spans.sort(key=lambda span: (span[2], span[1]))
+    return spans
+
+
+def _build_section_pattern(patterns: list[str]) -> Any:
+    """
+    Union the line-anchored SECTION_PATTERNS into one multiline pattern.
+    
+    Each alternative is wrapped in a ``p{i}`` group, so ``match.lastgroup``
+    tells which header form matched. Header lines may be indented.
+    
+    When google-re2 is installed the union is compiled as a DFA, so all
+    header forms are found in a single linear pass with no backtracking.
+    RE2's digit class is ASCII-only, so it is widened to Unicode decimal
+    digits as in the stdlib engine. Otherwise, or if RE2 rejects the
+    pattern, the stdlib ``re`` engine is used.
+    """
+    alternatives = "|".join(
+        f"(?P<p{i}>{pattern.lstrip('^').rstrip('$')})" for i, pattern in enumerate(patterns)
+    )
+    combined = rf"^[ \t]*(?:{alternatives})$"
+    
+    if re2 is not None:
+        try:
+            return re2.compile("(?m)" + combined.replace(r"\d", r"\p{Nd}"))
+        except re2.error:
+            pass
+    return re.compile(combined, re.MULTILINE)
+
+
+# Compiled once at import and shared by all instances
+_SECTION_RE = _build_section_pattern(TextProcessor.SECTION_PATTERNS)
+TextProcessor._SECTION_RE = _SECTION_RE
 
 
 def clean_whitespace(text: str) -> str:
@@ -204,11 +563,34 @@ def clean_whitespace(text: str) -> str:
     Returns:
         Text with normalized whitespace
     """
-    text = re.sub(r"\r\n", "\n", text)
-    text = re.sub(r"\r", "\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    if len(text) <= _CLEAN_CHUNK_CHARS:
+        return _clean_whitespace_chunk(text).strip()
+    
+    # Each cleaning pass copies its input, so a multi-MB document is
+    # streamed through in line-aligned chunks into one output buffer
+    buffer = io.StringIO()
+    start = 0
+    while start < len(text):
+        cut = _RE_CHUNK_CUT.search(text, start + _CLEAN_CHUNK_CHARS)
+        end = cut.end() if cut else len(text)
+        buffer.write(_clean_whitespace_chunk(text[start:end]))
+        start = end
+    return buffer.getvalue().strip()
+
+
+def _clean_whitespace_chunk(text: str) -> str:
+    """Normalize whitespace in text that no space or line-break run crosses."""
+    # Each pass is skipped when a substring scan shows it has nothing to
+    # do, so already-clean text costs only these scans
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\t" in text:
+        text = text.replace("\t", " ")
+    if "  " in text:
+        text = _RE_MULTI_SPACE.sub(" ", text)
+    if "\n\n\n" in text:
+        text = _RE_BLANKS.sub("\n\n", text)
+    return text
 
 
 def remove_page_numbers(text: str) -> str:
@@ -235,9 +617,11 @@ def extract_monetary_values(text: str) -> list[tuple[str, float]]:
     Returns:
         List of (original_text, numeric_value) tuples
     """
-    # TODO: Implement monetary extraction
-    # Handle formats: $1,000.00, $1000, One Thousand Dollars, etc.
-    raise NotImplementedError("Monetary extraction not yet implemented")
+    # TODO: Handle written amounts (One Thousand Dollars, etc.)
+    return [
+        (match.group(0), float(match.group(1).replace(",", "")))
+        for match in _MONEY_RE.finditer(text)
+    ]
 
 
 # TODO: Add language detection
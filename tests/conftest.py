@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Generator
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_lease_text() -> str:
     """Sample base lease text for testing."""
     return """
@@ -40,7 +40,7 @@ def sample_lease_text() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_amendment_text() -> str:
     """Sample amendment text for testing."""
     return """
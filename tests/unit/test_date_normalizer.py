@@ -0,0 +1,218 @@
+"""
+Lease Digitizer - Unit Tests for Date Normalizer
+
+Tests for the DateNormalizerTool date parsing helpers.
+"""
+
+import pytest
+from datetime import date
+from pydantic import ValidationError
+
+from src.tools import date_normalizer
+from src.tools.date_normalizer import DATE_PATTERNS, DateNormalizerTool
+
+
+@pytest.fixture
+def normalizer() -> DateNormalizerTool:
+    """Create a date normalizer instance."""
+    return DateNormalizerTool()
+
+
+class TestNormalize:
+    """Tests for single date normalization."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("January 15, 2024", date(2024, 1, 15)),
+        ("Jan. 15, 2024", date(2024, 1, 15)),
+        ("JANUARY 15, 2024", date(2024, 1, 15)),
+        ("jAnUaRy 15, 2024", date(2024, 1, 15)),
+        ("sept 1, 2024", None),
+        ("1/15/2024", date(2024, 1, 15)),
+        ("1/15/24", date(2024, 1, 15)),
+        ("2024-01-15", date(2024, 1, 15)),
+        ("15th day of January, 2024", date(2024, 1, 15)),
+    ])
+    def test_formats(
+        self, normalizer: DateNormalizerTool, text: str, expected: date | None
+    ) -> None:
+        """Test each supported date format."""
+        result = normalizer.normalize(text)
+        
+        assert result.normalized_date == expected
+        if expected is not None:
+            assert result.iso_format == expected.isoformat()
+            assert result.confidence == 1.0
+    
+    def test_empty_text(self, normalizer: DateNormalizerTool) -> None:
+        """Test empty input returns zero confidence."""
+        result = normalizer.normalize("   ")
+        
+        assert result.normalized_date is None
+        assert result.confidence == 0.0
+    
+    def test_invalid_calendar_date(self, normalizer: DateNormalizerTool) -> None:
+        """Test impossible dates are rejected."""
+        result = normalizer.normalize("February 30, 2024")
+        
+        assert result.normalized_date is None
+        assert result.confidence == 0.0
+    
+    def test_embedded_date_has_lower_confidence(self, normalizer: DateNormalizerTool) -> None:
+        """Test a date inside surrounding text is found with reduced confidence."""
+        result = normalizer.normalize("dated as of March 1, 2024")
+        
+        assert result.normalized_date == date(2024, 3, 1)
+        assert result.confidence < 1.0
+    
+    def test_result_is_frozen(self, normalizer: DateNormalizerTool) -> None:
+        """Test normalized results are immutable."""
+        result = normalizer.normalize("January 15, 2024")
+        
+        with pytest.raises(ValidationError):
+            result.confidence = 0.5
+
+
+class TestNormalizeBatch:
+    """Tests for batch normalization."""
+    
+    def test_matches_single_normalize(self, normalizer: DateNormalizerTool) -> None:
+        """Test each batch result equals normalizing that text alone."""
+        texts = [
+            "January 15, 2024",
+            "",
+            "no date here",
+            "Feb 30, 2024",
+            "dated 3/1/2024 and 4/1/2024",
+            "2024-12-31",
+        ]
+        
+        assert normalizer.normalize_batch(texts) == [normalizer.normalize(t) for t in texts]
+    
+    def test_no_match_spans_inputs(self, normalizer: DateNormalizerTool) -> None:
+        """Test a date split across two inputs is not stitched together."""
+        results = normalizer.normalize_batch(["January", "15, 2024"])
+        
+        assert [r.normalized_date for r in results] == [None, None]
+    
+    def test_empty_batch(self, normalizer: DateNormalizerTool) -> None:
+        """Test an empty batch returns an empty list."""
+        assert normalizer.normalize_batch([]) == []
+
+
+class TestResolveRelativeDate:
+    """Tests for relative date resolution."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("30 days after the commencement date", date(2024, 3, 1)),
+        ("thirty (30) days prior to expiration", date(2024, 1, 1)),
+        ("30 days prior  to the date", date(2024, 1, 1)),
+        ("30 days prior\nto expiration", date(2024, 1, 1)),
+        ("ninety days following", date(2024, 4, 30)),
+        ("12 months from the date hereof", date(2025, 1, 31)),
+        ("two years after", date(2026, 1, 31)),
+        ("one hundred twenty days after", date(2024, 5, 30)),
+        ("the date that is forty-five days after", date(2024, 3, 16)),
+        ("the first day of the month following", date(2024, 2, 1)),
+        ("the last day of the calendar month following", date(2024, 2, 29)),
+        ("last day of the month", date(2024, 1, 31)),
+    ])
+    def test_relative_forms(
+        self, normalizer: DateNormalizerTool, text: str, expected: date
+    ) -> None:
+        """Test each supported relative form against a fixed reference."""
+        result = normalizer.resolve_relative_date(text, date(2024, 1, 31))
+        
+        assert result.normalized_date == expected
+    
+    def test_unknown_quantity(self, normalizer: DateNormalizerTool) -> None:
+        """Test unparseable quantities are reported, not guessed."""
+        result = normalizer.resolve_relative_date("a few days after", date(2024, 1, 31))
+        
+        assert result.normalized_date is None
+        assert result.confidence == 0.0
+    
+    def test_business_days_rejected(self, normalizer: DateNormalizerTool) -> None:
+        """Test business-day offsets are reported, not counted as calendar days."""
+        for text in ("5 business days after", "five (5) business days after"):
+            result = normalizer.resolve_relative_date(text, date(2024, 1, 31))
+            
+            assert result.normalized_date is None
+            assert result.confidence == 0.0
+            assert "Business-day" in result.notes
+    
+    def test_absolute_date_falls_through(self, normalizer: DateNormalizerTool) -> None:
+        """Test an absolute date is normalized as-is."""
+        result = normalizer.resolve_relative_date("March 1, 2024", date(2024, 1, 31))
+        
+        assert result.normalized_date == date(2024, 3, 1)
+
+
+class TestFindDates:
+    """Tests for finding dates within text."""
+    
+    def test_find_dates(self, normalizer: DateNormalizerTool, sample_lease_text: str) -> None:
+        """Test all dates in a lease are found in document order."""
+        results = normalizer.find_dates(sample_lease_text)
+        
+        assert [r.normalized_date for r in results] == [
+            date(2024, 1, 15),
+            date(2024, 2, 1),
+            date(2029, 1, 31),
+        ]
+    
+    def test_find_dates_removes_duplicates(self, normalizer: DateNormalizerTool) -> None:
+        """Test the same date written two ways is reported once."""
+        results = normalizer.find_dates("Effective 2024-01-15 (January 15, 2024).")
+        
+        assert len(results) == 1
+        assert results[0].original_text == "2024-01-15"
+    
+    @pytest.mark.parametrize("text", [
+        "Signed January 15, 2024 and amended Jan. 3, 2025 by the mayor.",
+        "Rent starts on the 1st day of May, 2024 or 2/1/24, whichever is later.",
+        "Invalid: February 30, 2024; valid: DECEMBER 5, 2024.",
+        "İstanbul office opens March 1, 2024.",
+        "May 30, 2024-01-15",
+        "February 30, 2024-01-15 and June 1, 2024/5/6",
+        "Filed 2024-01-152nd May, 2024 and May 1, 20241/2/24.",
+    ])
+    def test_month_automaton_matches_regex(
+        self, normalizer: DateNormalizerTool, monkeypatch, text: str
+    ) -> None:
+        """Test the Aho-Corasick month scan finds the same dates as the regex."""
+        found = [(r.original_text, r.normalized_date) for r in normalizer.find_dates(text)]
+        monkeypatch.setattr(date_normalizer, "_MONTH_AUTOMATON", None)
+        
+        assert found == [
+            (r.original_text, r.normalized_date) for r in normalizer.find_dates(text)
+        ]
+
+
+def test_stdlib_fallback_matches_same_dates(monkeypatch, sample_lease_text: str) -> None:
+    """Test the stdlib regex fallback finds the same dates as the default engine."""
+    default = date_normalizer._COMBINED_DATE_RE
+    monkeypatch.setattr(date_normalizer, "re2", None)
+    fallback = date_normalizer._build_combined_pattern(DATE_PATTERNS)
+    
+    assert [m.group(0) for m in fallback.finditer(sample_lease_text)] == [
+        m.group(0) for m in default.finditer(sample_lease_text)
+    ]
+
+
+@pytest.mark.parametrize("text", [
+    "Commencement: January\xa015, 2024",
+    "Signed 15th\u2009day of March,\u202f2024",
+    "Filed \u0661/\u0662/\u0662\u0660\u0662\u0664 and \uff12\uff10\uff12\uff14-03-01",
+])
+def test_unicode_whitespace_and_digits(monkeypatch, text: str) -> None:
+    """Test both engines and find_dates agree on non-ASCII spaces and digits."""
+    default = date_normalizer._COMBINED_DATE_RE
+    monkeypatch.setattr(date_normalizer, "re2", None)
+    fallback = date_normalizer._build_combined_pattern(DATE_PATTERNS)
+    
+    matches = [m.group(0) for m in default.finditer(text)]
+    found = DateNormalizerTool().find_dates(text)
+    
+    assert matches
+    assert matches == [m.group(0) for m in fallback.finditer(text)]
+    assert [d.original_text for d in found] == matches
@@ -0,0 +1,177 @@
+"""
+Lease Digitizer - Unit Tests for Document Loader
+
+Tests for DocumentLoader file discovery and batch loading.
+"""
+
+import os
+import pickle
+
+import pytest
+from pathlib import Path
+
+from pypdf import PdfWriter
+
+from src.tools.pdf_parser import ParsedDocument
+from src.utils.document_loader import DocumentLoader
+
+
+@pytest.fixture
+def pdf_directory(tmp_path: Path) -> Path:
+    """Create a directory with real PDFs, an empty PDF and an ignored file."""
+    pdf_dir = tmp_path / "leases"
+    pdf_dir.mkdir()
+    
+    for name, pages in [("lease_a.pdf", 1), ("lease_b.pdf", 2)]:
+        writer = PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=612, height=792)
+        with open(pdf_dir / name, "wb") as f:
+            writer.write(f)
+    
+    (pdf_dir / "broken.pdf").touch()
+    (pdf_dir / "notes.txt").write_text("ignored")
+    return pdf_dir
+
+
+class TestDocumentLoader:
+    """Tests for DocumentLoader."""
+    
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_load_directory(self, mock_settings, pdf_directory: Path, parallel: bool) -> None:
+        """Test every supported file is yielded with a document or an error."""
+        loader = DocumentLoader(supported_extensions=["pdf"])
+        
+        results = {
+            path.name: result
+            for path, result in loader.load_directory(pdf_directory, parallel=parallel)
+        }
+        
+        assert set(results) == {"lease_a.pdf", "lease_b.pdf", "broken.pdf"}
+        assert isinstance(results["lease_a.pdf"], ParsedDocument)
+        assert results["lease_b.pdf"].metadata.page_count == 2
+        assert isinstance(results["broken.pdf"], Exception)
+    
+    def test_load_directory_invalid(self, mock_settings, tmp_path: Path) -> None:
+        """Test a missing directory raises ValueError."""
+        loader = DocumentLoader(supported_extensions=["pdf"])
+        
+        with pytest.raises(ValueError, match="Invalid directory"):
+            list(loader.load_directory(tmp_path / "missing"))
+
+    def test_load_file_uses_content_cache(
+        self, mock_settings, pdf_directory: Path, tmp_path: Path
+    ) -> None:
+        """Test identical file contents are served from the cache."""
+        cache_dir = tmp_path / "cache"
+        loader = DocumentLoader(supported_extensions=["pdf"], cache_dir=cache_dir)
+        copy = pdf_directory / "lease_a_copy.pdf"
+        copy.write_bytes((pdf_directory / "lease_a.pdf").read_bytes())
+        
+        first = loader.load_file(pdf_directory / "lease_a.pdf")
+        second = loader.load_file(copy)
+        
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+        assert second.metadata.page_count == first.metadata.page_count
+        assert second.metadata.filename == "lease_a_copy.pdf"
+
+    @pytest.mark.parametrize("payload", [b"", b"not a pickle", b"cnosuchmodule\nThing\n."])
+    def test_unreadable_cache_entry_is_a_miss(
+        self, mock_settings, pdf_directory: Path, tmp_path: Path, payload: bytes
+    ) -> None:
+        """Test corrupt or unimportable cache entries are re-parsed and replaced."""
+        cache_dir = tmp_path / "cache"
+        loader = DocumentLoader(supported_extensions=["pdf"], cache_dir=cache_dir)
+        loader.load_file(pdf_directory / "lease_b.pdf")
+        (entry,) = cache_dir.glob("*.pkl")
+        entry.write_bytes(payload)
+        
+        document = loader.load_file(pdf_directory / "lease_b.pdf")
+        
+        assert document.metadata.page_count == 2
+        assert entry.read_bytes() != payload
+    
+    def test_failed_cache_write_leaves_no_temp_file(
+        self, mock_settings, pdf_directory: Path, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test a failed cache write still returns the document and cleans up."""
+        cache_dir = tmp_path / "cache"
+        loader = DocumentLoader(supported_extensions=["pdf"], cache_dir=cache_dir)
+        
+        def failing_dump(*args, **kwargs):
+            raise pickle.PicklingError("cannot pickle")
+        
+        monkeypatch.setattr(pickle, "dump", failing_dump)
+        
+        document = loader.load_file(pdf_directory / "lease_a.pdf")
+        
+        assert document.metadata.page_count == 1
+        assert list(cache_dir.iterdir()) == []
+    
+    def test_unwritable_cache_dir_does_not_fail_load(
+        self, mock_settings, pdf_directory: Path, tmp_path: Path
+    ) -> None:
+        """Test a cache directory that cannot be created is skipped."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("not a directory")
+        loader = DocumentLoader(supported_extensions=["pdf"], cache_dir=cache_dir)
+        
+        document = loader.load_file(pdf_directory / "lease_b.pdf")
+        
+        assert document.metadata.page_count == 2
+
+    def test_get_file_list(self, mock_settings, pdf_directory: Path) -> None:
+        """Test file listing filters by extension and honours recursion."""
+        nested = pdf_directory / "amendments"
+        nested.mkdir()
+        (nested / "amendment_001.PDF").touch()
+        loader = DocumentLoader(supported_extensions=["pdf"])
+        
+        flat = loader.get_file_list(pdf_directory)
+        deep = loader.get_file_list(pdf_directory, recursive=True)
+        
+        assert [p.name for p in flat] == ["broken.pdf", "lease_a.pdf", "lease_b.pdf"]
+        assert nested / "amendment_001.PDF" in deep
+        assert len(deep) == 4
+    
+    def test_extensions_are_normalized(self, mock_settings, pdf_directory: Path) -> None:
+        """Test configured extensions match regardless of case or leading dot."""
+        loader = DocumentLoader(supported_extensions=[".PDF"])
+        
+        is_valid, error = loader.validate_file(pdf_directory / "lease_a.pdf")
+        
+        assert is_valid, error
+    
+    def test_extensionless_names_are_ignored(self, mock_settings, pdf_directory: Path) -> None:
+        """Test files named "pdf" or ".pdf" are not treated as PDFs."""
+        (pdf_directory / "pdf").touch()
+        (pdf_directory / ".pdf").touch()
+        loader = DocumentLoader(supported_extensions=["pdf"])
+        
+        names = [p.name for p in loader.get_file_list(pdf_directory)]
+        is_valid, error = loader.validate_file(pdf_directory / ".pdf")
+        
+        assert names == ["broken.pdf", "lease_a.pdf", "lease_b.pdf"]
+        assert not is_valid
+        assert error == "Unsupported extension: "
+    
+    def test_unreadable_subdirectory_is_skipped(
+        self, mock_settings, pdf_directory: Path, monkeypatch
+    ) -> None:
+        """Test a subdirectory that cannot be scanned is skipped."""
+        locked = pdf_directory / "locked"
+        locked.mkdir()
+        (locked / "hidden.pdf").touch()
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if path == str(locked):
+                raise PermissionError(path)
+            return real_scandir(path)
+        
+        monkeypatch.setattr(os, "scandir", scandir)
+        loader = DocumentLoader(supported_extensions=["pdf"])
+        
+        deep = loader.get_file_list(pdf_directory, recursive=True)
+        
+        assert [p.name for p in deep] == ["broken.pdf", "lease_a.pdf", "lease_b.pdf"]
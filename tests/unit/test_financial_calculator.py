@@ -0,0 +1,173 @@
+"""
+Lease Digitizer - Unit Tests for Financial Calculator
+
+Tests for the FinancialCalculatorTool rent and escalation math.
+"""
+
+import numpy as np
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from src.tools.financial_calculator import EscalationType, FinancialCalculatorTool
+
+
+@pytest.fixture
+def calculator() -> FinancialCalculatorTool:
+    """Create a financial calculator instance."""
+    return FinancialCalculatorTool()
+
+
+class TestEscalatedRent:
+    """Tests for escalation calculations."""
+    
+    def test_fixed_percentage(self, calculator: FinancialCalculatorTool) -> None:
+        """Test compounding percentage escalation is exact in Decimal."""
+        result = calculator.calculate_escalated_rent(
+            Decimal("10000"), EscalationType.FIXED_PERCENTAGE, Decimal("3"), periods=2
+        )
+        
+        assert result == Decimal("10609.00")
+    
+    def test_float_inputs(self, calculator: FinancialCalculatorTool) -> None:
+        """Test float rent and escalation values are coerced to Decimal."""
+        result = calculator.calculate_escalated_rent(
+            10000.0, EscalationType.FIXED_PERCENTAGE, 3.0, periods=2
+        )
+        
+        assert result == Decimal("10609.00")
+    
+    def test_fractional_periods_rejected(self, calculator: FinancialCalculatorTool) -> None:
+        """Test a fractional period count raises rather than being truncated."""
+        with pytest.raises(ValueError, match="whole number"):
+            calculator.calculate_escalated_rent(
+                Decimal("10000"), EscalationType.FIXED_PERCENTAGE, Decimal("3"), periods=1.5
+            )
+    
+    def test_fixed_amount(self, calculator: FinancialCalculatorTool) -> None:
+        """Test fixed amount escalation adds per period."""
+        result = calculator.calculate_escalated_rent(
+            Decimal("10000"), EscalationType.FIXED_AMOUNT, Decimal("250"), periods=3
+        )
+        
+        assert result == Decimal("10750.00")
+    
+    def test_cpi_unsupported(self, calculator: FinancialCalculatorTool) -> None:
+        """Test CPI escalation raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            calculator.calculate_escalated_rent(
+                Decimal("10000"), EscalationType.CPI, Decimal("3")
+            )
+
+
+class TestRentSchedule:
+    """Tests for rent schedule generation."""
+    
+    def test_schedule_with_partial_final_period(self, calculator: FinancialCalculatorTool) -> None:
+        """Test escalations apply per period and the last period is prorated by months."""
+        schedule = calculator.calculate_rent_schedule(
+            base_rent=Decimal("10000"),
+            start_date=date(2024, 1, 1),
+            term_months=30,
+            escalation_type=EscalationType.FIXED_PERCENTAGE,
+            escalation_value=Decimal("3"),
+            square_feet=Decimal("5000"),
+        )
+        
+        assert [item.monthly_rent for item in schedule.items] == [
+            Decimal("10000.00"), Decimal("10300.00"), Decimal("10609.00"),
+        ]
+        assert schedule.items[0].period_end == date(2024, 12, 31)
+        assert schedule.items[-1].period_start == date(2026, 1, 1)
+        assert schedule.items[-1].period_end == date(2026, 6, 30)
+        assert schedule.items[0].rent_psf == Decimal("24.00")
+        assert schedule.total_rent == Decimal("307254.00")
+        assert schedule.average_rent == Decimal("10241.80")
+    
+    def test_schedule_fixed_amount(self, calculator: FinancialCalculatorTool) -> None:
+        """Test fixed amount escalations in the schedule."""
+        schedule = calculator.calculate_rent_schedule(
+            base_rent=Decimal("5000"),
+            start_date=date(2024, 1, 1),
+            term_months=24,
+            escalation_type=EscalationType.FIXED_AMOUNT,
+            escalation_value=Decimal("100"),
+        )
+        
+        assert [item.monthly_rent for item in schedule.items] == [
+            Decimal("5000.00"), Decimal("5100.00"),
+        ]
+        assert schedule.items[0].rent_psf is None
+    
+    def test_invalid_term(self, calculator: FinancialCalculatorTool) -> None:
+        """Test a non-positive term raises ValueError."""
+        with pytest.raises(ValueError):
+            calculator.calculate_rent_schedule(
+                base_rent=Decimal("5000"), start_date=date(2024, 1, 1), term_months=0
+            )
+
+
+class TestProrate:
+    """Tests for pro-rata calculations."""
+    
+    def test_partial_month(self, calculator: FinancialCalculatorTool) -> None:
+        """Test prorating a mid-month move-in."""
+        result = calculator.calculate_prorate(
+            Decimal("3100"),
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            prorate_start=date(2024, 1, 17),
+            prorate_end=date(2024, 2, 15),
+        )
+        
+        assert result.days_in_period == 31
+        assert result.days_applicable == 15
+        assert result.prorated_amount == Decimal("1500.00")
+    
+    def test_no_overlap(self, calculator: FinancialCalculatorTool) -> None:
+        """Test ranges that don't intersect prorate to zero."""
+        result = calculator.calculate_prorate(
+            Decimal("3100"),
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            prorate_start=date(2024, 3, 1),
+            prorate_end=date(2024, 3, 31),
+        )
+        
+        assert result.days_applicable == 0
+        assert result.prorated_amount == Decimal("0.00")
+
+
+class TestNPV:
+    """Tests for net present value."""
+    
+    def test_npv(self, calculator: FinancialCalculatorTool) -> None:
+        """Test NPV discounts each period after the first."""
+        result = calculator.calculate_npv(
+            [Decimal("-1000"), Decimal("550"), Decimal("605")], Decimal("0.10")
+        )
+        
+        assert result == Decimal("0.00")
+    
+    def test_npv_high_precision_uses_decimal(self) -> None:
+        """Test the exact Decimal path agrees with the vectorized path."""
+        calculator = FinancialCalculatorTool(precision=12)
+        result = calculator.calculate_npv(
+            [Decimal("100"), Decimal("100"), Decimal("100")], Decimal("0.05")
+        )
+        
+        assert result == Decimal("285.941043083900")
+    
+    def test_npv_empty(self, calculator: FinancialCalculatorTool) -> None:
+        """Test NPV of no cash flows is zero."""
+        assert calculator.calculate_npv([], Decimal("0.05")) == Decimal("0.00")
+    
+    def test_npv_numba_kernel_matches_numpy(self) -> None:
+        """Test the Numba kernel agrees with the vectorized NumPy sum."""
+        pytest.importorskip("numba")
+        from src.tools._financial_numba import npv_f64
+        
+        flows = np.linspace(-5000.0, 5000.0, 240)
+        expected = float((flows / 1.004 ** np.arange(len(flows))).sum())
+        
+        assert npv_f64(flows, 0.004) == pytest.approx(expected, rel=1e-12)
@@ -4,13 +4,18 @@ Lease Digitizer - Unit Tests for Lease Extractor
 Tests for the LeaseExtractorAgent LLMChain implementation.
 """
 
+import asyncio
+import json
+
 import pytest
 from datetime import date
 from decimal import Decimal
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
 
 from src.agents.lease_extractor import (
     ExtractionMetadata,
     ExtractionResult,
+    LeaseExtractionCache,
     LeaseExtractorAgent,
 )
 from src.schemas.lease import (
@@ -22,6 +27,16 @@ from src.schemas.lease import (
 )
 
 
+class RecordingChatModel(FakeListChatModel):
+    """Fake chat model that records the messages of every call."""
+    
+    calls: list = []
+    
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(messages)
+        return super()._call(messages, stop, run_manager, **kwargs)
+
+
 class TestExtractionResult:
     """Tests for ExtractionResult schema."""
     
@@ -138,6 +153,149 @@ class TestLeaseExtractorAgent:
         with pytest.raises(ValueError, match="cannot be empty"):
             extractor.extract_lease("", "test-id")
     
+    def test_extract_leases_batch(self, extractor: LeaseExtractorAgent) -> None:
+        """Test one batched response is mapped back to each document id."""
+        reply = json.dumps({
+            "results": [
+                {"document_id": "lease-b", "lease": {"tenant": {"legal_name": "Tenant B"}}},
+                {"document_id": "lease-a", "lease": {"tenant": {"legal_name": "Tenant A"}}},
+            ]
+        })
+        extractor._llm = FakeListChatModel(responses=[reply])
+        
+        results = extractor.extract_leases_batch([
+            ("lease-a", "Lease A text"),
+            ("lease-b", "Lease B text"),
+            ("lease-c", "Lease C text"),
+        ])
+        
+        assert list(results) == ["lease-a", "lease-b", "lease-c"]
+        assert results["lease-a"].lease.tenant.legal_name == "Tenant A"
+        assert results["lease-a"].lease.document_id == "lease-a"
+        assert results["lease-b"].lease.tenant.legal_name == "Tenant B"
+        assert results["lease-a"].raw_response == reply
+        assert results["lease-c"].lease is None
+        assert "lease-c" in results["lease-c"].raw_response
+    
+    def test_extract_lease_retries_invalid_output(
+        self, extractor: LeaseExtractorAgent, monkeypatch
+    ) -> None:
+        """Test a reply that fails validation is re-prompted, not failed."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("src.agents.lease_extractor.time.sleep", sleeps.append)
+        extractor._llm = FakeListChatModel(responses=[
+            "not json",
+            json.dumps({"tenant": {"legal_name": "Tenant A"}}),
+        ])
+        
+        result = extractor.extract_lease("Lease A text", "lease-a")
+        
+        assert result.lease.tenant.legal_name == "Tenant A"
+        assert sleeps == [1.0]
+    
+    def test_retry_prompt_quotes_only_the_error(
+        self, extractor: LeaseExtractorAgent, monkeypatch
+    ) -> None:
+        """Test the retry message carries the validation error, not the reply."""
+        monkeypatch.setattr("src.agents.lease_extractor.time.sleep", lambda _: None)
+        bad_reply = json.dumps({"rentable_square_feet": "five thousand"})
+        extractor._llm = RecordingChatModel(responses=[
+            bad_reply,
+            json.dumps({"rentable_square_feet": 5000}),
+        ])
+        
+        result = extractor.extract_lease("Lease A text", "lease-a")
+        
+        assert result.lease.rentable_square_feet == 5000
+        retry_messages = extractor._llm.calls[1]
+        assert len(retry_messages) == 3
+        assert retry_messages[1].content == bad_reply
+        feedback = retry_messages[2].content
+        assert feedback.startswith("Your output had error: rentable_square_feet:")
+        assert "five thousand" not in feedback
+    
+    def test_extract_lease_gives_up_after_max_retries(
+        self, extractor: LeaseExtractorAgent, monkeypatch
+    ) -> None:
+        """Test extraction fails once every retry is exhausted."""
+        monkeypatch.setattr("src.agents.lease_extractor.time.sleep", lambda _: None)
+        extractor._llm = FakeListChatModel(responses=["not json"] * 3)
+        
+        result = extractor.extract_lease("Lease A text", "lease-a")
+        
+        assert result.lease is None
+        assert result.raw_response.startswith("Error:")
+    
+    def test_extract_lease_async(self, extractor: LeaseExtractorAgent) -> None:
+        """Test async extraction parses the reply like extract_lease."""
+        extractor._llm = FakeListChatModel(responses=[
+            json.dumps({"tenant": {"legal_name": "Tenant A"}}),
+        ])
+        
+        result = asyncio.run(extractor.extract_lease_async("Lease A text", "lease-a"))
+        
+        assert result.lease.tenant.legal_name == "Tenant A"
+        assert result.lease.document_id == "lease-a"
+    
+    def test_extract_lease_async_retries_like_sync(
+        self, extractor: LeaseExtractorAgent, monkeypatch
+    ) -> None:
+        """Test async extraction follows the same re-prompt and delay schedule."""
+        sleeps: list[float] = []
+        
+        async def record_sleep(delay: float) -> None:
+            sleeps.append(delay)
+        
+        monkeypatch.setattr("src.agents.lease_extractor.asyncio.sleep", record_sleep)
+        extractor._llm = FakeListChatModel(responses=[
+            "not json",
+            "still not json",
+            json.dumps({"tenant": {"legal_name": "Tenant A"}}),
+        ])
+        
+        result = asyncio.run(extractor.extract_lease_async("Lease A text", "lease-a"))
+        
+        assert result.lease.tenant.legal_name == "Tenant A"
+        assert sleeps == [1.0, 2.0]
+    
+    def test_extract_lease_stream(self, extractor: LeaseExtractorAgent) -> None:
+        """Test streaming yields growing partial leases, then the final result."""
+        extractor._llm = FakeListChatModel(responses=[json.dumps({
+            "tenant": {"legal_name": "Tenant A"},
+            "landlord": {"legal_name": "Landlord A"},
+            "rentable_square_feet": 5000,
+        })])
+        
+        results = list(extractor.extract_lease_stream("Lease A text", "lease-a"))
+        
+        assert len(results) == 3
+        assert results[0].lease.tenant.legal_name == "Tenant A"
+        assert results[0].lease.landlord is None
+        assert results[1].lease.landlord.legal_name == "Landlord A"
+        final = results[-1].lease
+        assert final.rentable_square_feet == 5000
+        assert final.document_id == "lease-a"
+    
+    def test_parse_lease_response(self, extractor: LeaseExtractorAgent) -> None:
+        """Test a reply to build_lease_prompt parses like an extract_lease reply."""
+        prompt = extractor.build_lease_prompt("Lease text")
+        assert "Lease text" in prompt
+        
+        reply = json.dumps({"tenant": {"legal_name": "Tenant A"}})
+        result = extractor.parse_lease_response(reply, "lease-a")
+        assert result.lease.tenant.legal_name == "Tenant A"
+        assert result.lease.document_id == "lease-a"
+        
+        failed = extractor.parse_lease_response("not json", "lease-b")
+        assert failed.lease is None
+    
+    def test_extract_leases_batch_rejects_duplicate_ids(
+        self, extractor: LeaseExtractorAgent
+    ) -> None:
+        """Test repeated document ids in one batch raise ValueError."""
+        with pytest.raises(ValueError, match="unique"):
+            extractor.extract_leases_batch([("lease-a", "One"), ("lease-a", "Two")])
+    
     @pytest.mark.skip(reason="Requires LLM implementation")
     def test_extract_basic_lease_data(self, extractor: LeaseExtractorAgent) -> None:
         """Test extraction of basic lease data."""
@@ -165,3 +323,75 @@ class TestLeaseExtractorAgent:
 # TODO: Add tests for multi-pass extraction
 # TODO: Add tests for handling malformed data
 # TODO: Add tests for confidence scoring
+
+
+class TestLeaseExtractionCache:
+    """Tests for the on-disk lease extraction cache."""
+    
+    def test_cache_round_trip(self, tmp_path) -> None:
+        """Test a stored lease is returned for the same key only."""
+        cache = LeaseExtractionCache(tmp_path)
+        key = cache.key("Lease text", "lease-a", "gpt-4o")
+        assert cache.get(key) is None
+        
+        cache.put(key, Lease(document_id="lease-a", tenant={"legal_name": "Tenant A"}), "gpt-4o")
+        
+        assert cache.get(key).tenant.legal_name == "Tenant A"
+        assert cache.key("Lease text", "lease-a", "gpt-4o-mini") != key
+        assert cache.key("Lease text!", "lease-a", "gpt-4o") != key
+    
+    def test_extract_replays_the_stored_reply(self, tmp_path) -> None:
+        """Test a cache hit reports the model's original reply as raw_response."""
+        cache = LeaseExtractionCache(tmp_path)
+        extractor = LeaseExtractorAgent(verbose=False)
+        reply = json.dumps({"tenant": {"legal_name": "Tenant A"}})
+        extractor._llm = FakeListChatModel(responses=[reply])
+        
+        first = cache.extract(extractor, "Lease text", "lease-a")
+        second = cache.extract(extractor, "Lease text", "lease-a")
+        
+        assert first.raw_response == reply
+        assert second.raw_response == reply
+        assert second.lease.tenant.legal_name == "Tenant A"
+    
+    def test_entry_without_reply_has_no_raw_response(self, tmp_path) -> None:
+        """Test a hit stored without the reply does not invent one."""
+        cache = LeaseExtractionCache(tmp_path)
+        key = cache.key("Lease text", "lease-a", "gpt-4o")
+        cache.put(key, Lease(document_id="lease-a"), "gpt-4o")
+        
+        result = cache.cached_result(LeaseExtractorAgent(verbose=False), key, "lease-a")
+        
+        assert result.lease.document_id == "lease-a"
+        assert result.raw_response is None
+    
+    def test_failed_put_leaves_no_temp_file(self, tmp_path, monkeypatch) -> None:
+        """Test a failed write removes its temporary file."""
+        cache = LeaseExtractionCache(tmp_path)
+        key = cache.key("Lease text", "lease-a", "gpt-4o")
+        
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr("src.agents.lease_extractor.os.replace", failing_replace)
+        
+        with pytest.raises(OSError):
+            cache.put(key, Lease(document_id="lease-a"), "gpt-4o")
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_corrupt_entry_is_a_miss(self, tmp_path) -> None:
+        """Test an unreadable entry falls back to extraction."""
+        cache = LeaseExtractionCache(tmp_path)
+        key = cache.key("Lease text", "lease-a", "gpt-4o")
+        (tmp_path / f"{key}.json").write_text("{not json")
+        
+        assert cache.get(key) is None
+    
+    def test_from_env(self, tmp_path, monkeypatch) -> None:
+        """Test the cache is only enabled when LEASE_CACHE_DIR is set."""
+        monkeypatch.delenv("LEASE_CACHE_DIR", raising=False)
+        assert LeaseExtractionCache.from_env() is None
+        
+        monkeypatch.setenv("LEASE_CACHE_DIR", str(tmp_path))
+        assert LeaseExtractionCache.from_env().cache_dir == tmp_path
@@ -5,12 +5,32 @@ A runnable test to verify the LeaseExtractorAgent works with a sample lease.
 Run directly with: python tests/unit/test_lease_extractor_simple.py
 """
 
+import argparse
+import asyncio
+import json
 import os
 import sys
+import tempfile
+import time
+
+from pydantic import BaseModel
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+# Imported once at load; a failure is reported by the test instead of raised
+try:
+    from src.agents.lease_extractor import LeaseExtractionCache, LeaseExtractorAgent
+    _IMPORT_ERR = None
+except ImportError as e:
+    LeaseExtractionCache = LeaseExtractorAgent = None
+    _IMPORT_ERR = e
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv is optional; fall back to the environment
+    load_dotenv = None
+
 
 SAMPLE_LEASE = """
 COMMERCIAL LEASE AGREEMENT
@@ -35,8 +55,234 @@ Annual Rent: $120,000.00
 The Tenant agrees to pay rent on the first day of each month.
 """
 
+SAMPLE_LEASE_RETAIL = """
+RETAIL LEASE AGREEMENT
+
+This Lease Agreement dated March 1, 2024
+
+LANDLORD: Harbor Retail Partners LP, a Delaware limited partnership
+TENANT: Green Leaf Cafe Inc., a Washington corporation
+
+PROPERTY: 450 Pine Street, Unit 2, Seattle, WA 98101
+Rentable Square Feet: 2,400 square feet
+
+TERM:
+Commencement Date: April 1, 2024
+Expiration Date: March 31, 2029
+Lease Term: 60 months
+
+RENT:
+Base Rent: $8,400.00 per month
+Annual Rent: $100,800.00
+
+Security Deposit: $16,800.00
+"""
+
+# (document_id, document_text) pairs extracted together in one request
+SAMPLE_LEASES = [
+    ("test-lease-001", SAMPLE_LEASE),
+    ("test-lease-002", SAMPLE_LEASE_RETAIL),
+]
+
+# Previews printed before extraction, built once per document
+PREVIEW_LEN = 200
+_SAMPLE_PREVIEWS = {
+    document_id: f"{document_text[:PREVIEW_LEN]}..."
+    for document_id, document_text in SAMPLE_LEASES
+}
+
+
+# Concurrency and rate limits for the default (async) extraction path
+MAX_CONCURRENT_REQUESTS = 10
+REQUESTS_PER_MINUTE = 500
+TOKENS_PER_MINUTE = 200_000
+# Completion budget counted against the token limit for every request
+RESPONSE_TOKEN_ALLOWANCE = 2_000
+
+# Terminal states of an OpenAI batch job
+_BATCH_DONE_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def submit_batch(client, jsonl_path):
+    """Upload a JSONL request file and start an OpenAI batch job; return its id."""
+    with open(jsonl_path, "rb") as f:
+        batch_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
 
-def test_lease_extraction():
+def wait_for_batch(client, batch_id, initial_delay=5.0, max_delay=300.0):
+    """Poll a batch job with exponential backoff until it reaches a final state."""
+    delay = initial_delay
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        print(f"   Batch {batch_id}: {batch.status}")
+        if batch.status in _BATCH_DONE_STATUSES:
+            return batch
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+def extract_with_batch_api(extractor, documents):
+    """
+    Extract leases through the OpenAI Batch API (half price, up to 24h turnaround).
+    
+    Each document becomes one JSONL request carrying the same prompt that
+    extract_lease sends; replies are parsed into ExtractionResults by id.
+    """
+    from openai import OpenAI
+    
+    client = OpenAI(api_key=extractor.settings.openai_api_key.get_secret_value())
+    start_time = time.time()
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        for document_id, document_text in documents:
+            request = {
+                "custom_id": document_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": extractor.model_name,
+                    "temperature": extractor.temperature,
+                    "messages": [
+                        {"role": "user", "content": extractor.build_lease_prompt(document_text)},
+                    ],
+                },
+            }
+            f.write(json.dumps(request) + "\n")
+        jsonl_path = f.name
+    
+    try:
+        batch_id = submit_batch(client, jsonl_path)
+    finally:
+        os.remove(jsonl_path)
+    
+    batch = wait_for_batch(client, batch_id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+    
+    replies = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        record = json.loads(line)
+        body = (record.get("response") or {}).get("body") or {}
+        if body.get("choices"):
+            replies[record["custom_id"]] = body["choices"][0]["message"]["content"]
+        else:
+            replies[record["custom_id"]] = f"Batch request failed: {record.get('error')}"
+    
+    return {
+        document_id: extractor.parse_lease_response(
+            replies.get(document_id, "No output returned"), document_id, start_time
+        )
+        for document_id, _ in documents
+    }
+
+
+class RateLimiter:
+    """
+    Token bucket over requests/min and tokens/min, shared by all tasks.
+    
+    Both budgets refill continuously; a request waits until one request
+    and its estimated tokens are available, which keeps bursts under the
+    account's RPM/TPM limits instead of tripping 429s.
+    """
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed_minutes = (now - self._updated) / 60
+        self._updated = now
+        self._requests = min(
+            self.requests_per_minute,
+            self._requests + elapsed_minutes * self.requests_per_minute,
+        )
+        self._tokens = min(
+            self.tokens_per_minute,
+            self._tokens + elapsed_minutes * self.tokens_per_minute,
+        )
+    
+    async def acquire(self, tokens):
+        """Wait until one request and `tokens` tokens fit, then consume them."""
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            self._refill()
+            if self._requests >= 1 and self._tokens >= tokens:
+                self._requests -= 1
+                self._tokens -= tokens
+                return
+            await asyncio.sleep(0.1)
+
+
+async def _extract_one(sem, limiter, cache, extractor, doc_id, text):
+    """Extract one lease, holding a concurrency slot and its rate budget."""
+    if cache is not None:
+        key = cache.key(text, doc_id, extractor.model_name)
+        cached = cache.cached_result(extractor, key, doc_id)
+        if cached is not None:
+            print(f"   ♻️  {doc_id}: loaded from cache")
+            return cached
+    
+    tokens = len(extractor.build_lease_prompt(text)) // 4 + RESPONSE_TOKEN_ALLOWANCE
+    async with sem:
+        await limiter.acquire(tokens)
+        result = await extractor.extract_lease_async(document_text=text, document_id=doc_id)
+    
+    if cache is not None and result.lease is not None:
+        cache.put(key, result.lease, extractor.model_name, result.raw_response)
+    return result
+
+
+async def _extract_concurrently(extractor, documents):
+    """Run extractions concurrently; failures come back as exceptions in place."""
+    # Opt-in: set LEASE_CACHE_DIR (e.g. .cache/lease_extract) to skip the
+    # LLM on re-runs over unchanged sample text
+    cache = LeaseExtractionCache.from_env()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = RateLimiter(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
+    tasks = [
+        _extract_one(sem, limiter, cache, extractor, doc_id, text)
+        for doc_id, text in documents
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def print_new_fields(lease, printed):
+    """Print top-level lease fields not yet in `printed`, then record them."""
+    for name, value in lease:
+        if value in (None, [], {}) or name in printed:
+            continue
+        printed.add(name)
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude_none=True)
+        print(f"   ⏱️  {name}: {value}")
+
+
+def extract_streaming(extractor, documents):
+    """Extract leases one at a time, printing each field as it arrives."""
+    results = {}
+    for document_id, document_text in documents:
+        print(f"\n📡 Streaming {document_id}...")
+        # Metadata fields are computed locally, not streamed from the model
+        printed = {"document_id", "confidence_score"}
+        result = None
+        for result in extractor.extract_lease_stream(document_text, document_id):
+            if result.lease is not None:
+                print_new_fields(result.lease, printed)
+        results[document_id] = result
+    return results
+
+
+def test_lease_extraction(use_batch_api=False, stream=False, combined=False):
     """Test the LeaseExtractorAgent with a sample lease document."""
     
     print("=" * 60)
@@ -56,17 +302,16 @@ def test_lease_extraction():
     
     print(f"\n✅ API Key found (starts with: {api_key[:10]}...)")
     
-    # Import after path setup
-    try:
-        from src.agents.lease_extractor import LeaseExtractorAgent
-    except ImportError as e:
-        print(f"\n❌ Import error: {e}")
+    if _IMPORT_ERR is not None:
+        print(f"\n❌ Import error: {_IMPORT_ERR}")
         print("Make sure you're running from the project root directory.")
         return False
     
     print("\n📄 Sample Lease Text:")
-    print("-" * 40)
-    print(SAMPLE_LEASE[:200] + "...")
+    for document_id, preview in _SAMPLE_PREVIEWS.items():
+        print("-" * 40)
+        print(f"[{document_id}]")
+        print(preview)
     print("-" * 40)
     
     # Initialize the extractor
@@ -78,22 +323,75 @@ def test_lease_extraction():
         print(f"   ❌ Failed to initialize agent: {e}")
         return False
     
-    # Extract lease data
-    print("\n🚀 Extracting lease data...")
-    print("   (This may take 10-30 seconds...)")
-    
     try:
-        result = extractor.extract_lease(
-            document_text=SAMPLE_LEASE,
-            document_id="test-lease-001"
-        )
+        if use_batch_api:
+            # Bulk/nightly runs: half the token price, results within 24 hours
+            print(f"\n🚀 Submitting {len(SAMPLE_LEASES)} leases to the OpenAI Batch API...")
+            print("   (This may take up to 24 hours...)")
+            results = extract_with_batch_api(extractor, SAMPLE_LEASES)
+        elif stream:
+            # Show fields as the model produces them instead of after the whole reply
+            print(f"\n🚀 Streaming {len(SAMPLE_LEASES)} lease extractions...")
+            results = extract_streaming(extractor, SAMPLE_LEASES)
+        elif combined:
+            # Extract all sample leases in one request, sharing the prompt overhead
+            print(f"\n🚀 Extracting {len(SAMPLE_LEASES)} leases in one combined request...")
+            print("   (This may take 10-30 seconds...)")
+            results = extractor.extract_leases_batch(documents=SAMPLE_LEASES)
+        else:
+            # Overlap network latency: wall clock ~ slowest request, not the sum
+            print(f"\n🚀 Extracting {len(SAMPLE_LEASES)} leases concurrently...")
+            print("   (This may take 10-30 seconds...)")
+            outcomes = asyncio.run(_extract_concurrently(extractor, SAMPLE_LEASES))
+            results = dict(zip((doc_id for doc_id, _ in SAMPLE_LEASES), outcomes))
     except Exception as e:
         print(f"\n❌ Extraction failed with error: {e}")
         return False
     
+    success = True
+    for document_id, result in results.items():
+        if isinstance(result, BaseException):
+            print(f"\n❌ Extraction of {document_id} failed with error: {result}")
+            success = False
+            continue
+        success = _print_result(document_id, result) and success
+    
+    if not success:
+        return False
+    
+    print("\n" + "=" * 60)
+    print("TEST COMPLETED SUCCESSFULLY ✅")
+    print("=" * 60)
+    
+    return True
+
+
+def _format_address(addr):
+    """Format a property address on one line."""
+    return f"{addr.street_address}, {addr.city}, {addr.state} {addr.zip_code}"
+
+
+# Extracted fields to report: (label, accessor, formatter); the formatter
+# only sees values that were extracted
+FIELDS = [
+    ("Tenant", lambda lease: lease.tenant and lease.tenant.legal_name, str),
+    ("Landlord", lambda lease: lease.landlord and lease.landlord.legal_name, str),
+    ("Property", lambda lease: lease.property_address, _format_address),
+    ("Square Feet", lambda lease: lease.rentable_square_feet, lambda v: f"{v:,}"),
+    ("Commencement", lambda lease: lease.commencement_date, str),
+    ("Expiration", lambda lease: lease.expiration_date, str),
+    ("Term (months)", lambda lease: lease.term_months, str),
+    ("Monthly Rent", lambda lease: lease.base_rent_monthly, lambda v: f"${v:,.2f}"),
+    ("Annual Rent", lambda lease: lease.base_rent_annual, lambda v: f"${v:,.2f}"),
+]
+
+
+def _print_result(document_id, result):
+    """Print the extraction result for one document; return whether it succeeded."""
+    
     # Check results
     print("\n" + "=" * 60)
-    print("EXTRACTION RESULTS")
+    print(f"EXTRACTION RESULTS: {document_id}")
     print("=" * 60)
     
     if result.lease is None:
@@ -109,46 +407,9 @@ def test_lease_extraction():
     print("\n📋 Extracted Data:")
     print("-" * 40)
     
-    # Tenant info
-    if lease.tenant:
-        print(f"   Tenant: {lease.tenant.legal_name}")
-    else:
-        print("   Tenant: Not extracted")
-    
-    # Landlord info
-    if lease.landlord:
-        print(f"   Landlord: {lease.landlord.legal_name}")
-    else:
-        print("   Landlord: Not extracted")
-    
-    # Property info
-    if lease.property_address:
-        addr = lease.property_address
-        print(f"   Property: {addr.street_address}, {addr.city}, {addr.state} {addr.zip_code}")
-    else:
-        print("   Property: Not extracted")
-    
-    # Square footage
-    if lease.rentable_square_feet:
-        print(f"   Square Feet: {lease.rentable_square_feet:,}")
-    else:
-        print("   Square Feet: Not extracted")
-    
-    # Dates
-    print(f"   Commencement: {lease.commencement_date}")
-    print(f"   Expiration: {lease.expiration_date}")
-    print(f"   Term (months): {lease.term_months}")
-    
-    # Rent
-    if lease.base_rent_monthly:
-        print(f"   Monthly Rent: ${lease.base_rent_monthly:,.2f}")
-    else:
-        print("   Monthly Rent: Not extracted")
-    
-    if lease.base_rent_annual:
-        print(f"   Annual Rent: ${lease.base_rent_annual:,.2f}")
-    else:
-        print("   Annual Rent: Not extracted")
+    for label, get, fmt in FIELDS:
+        value = get(lease)
+        print(f"   {label}: {fmt(value) if value is not None else 'Not extracted'}")
     
     # Metadata
     print("\n📊 Extraction Metadata:")
@@ -161,21 +422,35 @@ def test_lease_extraction():
     if result.metadata.missing_fields:
         print(f"   Missing Fields: {', '.join(result.metadata.missing_fields)}")
     
-    print("\n" + "=" * 60)
-    print("TEST COMPLETED SUCCESSFULLY ✅")
-    print("=" * 60)
-    
     return True
 
 
 if __name__ == "__main__":
-    # Load .env file if it exists
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-        print("📁 Loaded .env file")
-    except ImportError:
-        print("ℹ️  python-dotenv not installed, using environment variables directly")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit through the OpenAI Batch API (cheaper, up to 24h turnaround)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream each extraction, printing fields as they arrive",
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Extract every sample lease in a single request",
+    )
+    args = parser.parse_args()
+    
+    # Load .env file if it exists, unless the key is already set (e.g. in CI)
+    if not os.environ.get("OPENAI_API_KEY"):
+        if load_dotenv is not None:
+            load_dotenv()
+            print("📁 Loaded .env file")
+        else:
+            print("ℹ️  python-dotenv not installed, using environment variables directly")
     
-    success = test_lease_extraction()
+    success = test_lease_extraction(use_batch_api=args.batch, stream=args.stream, combined=args.combined)
     sys.exit(0 if success else 1)
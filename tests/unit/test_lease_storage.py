@@ -0,0 +1,54 @@
+"""
+Lease Digitizer - Unit Tests for Lease Storage
+
+Tests for the JSON-file backed LeaseStorage.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.schemas.lease import Lease, Party
+from src.storage.lease_storage import LeaseStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LeaseStorage:
+    """Create a storage instance backed by a temporary file."""
+    return LeaseStorage(storage_file=str(tmp_path / "lease_store.json"))
+
+
+class TestLeaseStorage:
+    """Tests for LeaseStorage persistence."""
+    
+    def test_add_and_get_lease(self, storage: LeaseStorage) -> None:
+        """Test a stored lease round-trips back into a Lease object."""
+        lease = Lease(document_id="lease-001", tenant=Party(legal_name="Test Tenant LLC"))
+        storage.add_lease(lease, "lease-001")
+        
+        loaded = storage.get_lease("lease-001")
+        
+        assert loaded is not None
+        assert loaded.document_id == "lease-001"
+        assert loaded.tenant.legal_name == "Test Tenant LLC"
+        assert storage.get_lease("missing") is None
+    
+    def test_store_is_written_compact(self, storage: LeaseStorage) -> None:
+        """Test the on-disk file uses compact JSON separators."""
+        storage.add_lease(Lease(document_id="lease-001"), "lease-001")
+        
+        raw = Path(storage.storage_file).read_text(encoding="utf-8")
+        
+        assert "\n" not in raw
+        assert '": ' not in raw
+        assert "lease-001" in json.loads(raw)
+    
+    def test_dump_pretty(self, storage: LeaseStorage) -> None:
+        """Test pretty output is indented and matches stored data."""
+        storage.add_lease(Lease(document_id="lease-001"), "lease-001")
+        
+        pretty = storage.dump_pretty()
+        
+        assert '\n  "lease-001"' in pretty
+        assert json.loads(pretty)["lease-001"]["id"] == "lease-001"
@@ -0,0 +1,166 @@
+"""
+Lease Digitizer - Unit Tests for PDF Parser
+
+Tests for the PDFParserTool using small generated PDFs.
+"""
+
+import pytest
+from pathlib import Path
+
+from pypdf import PdfWriter
+
+from src.tools import pdf_parser
+from src.tools.pdf_parser import PageContent, ParsedDocument, PDFMetadata, PDFParserTool
+
+
+BACKENDS = [
+    pytest.param(
+        "pymupdf",
+        marks=pytest.mark.skipif(pdf_parser.pymupdf is None, reason="PyMuPDF not installed"),
+    ),
+    "pdfplumber",
+    "pypdf",
+]
+
+
+@pytest.fixture
+def blank_pdf(tmp_path: Path) -> Path:
+    """Create a three-page blank PDF."""
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=612, height=792)
+    writer.add_metadata({"/Title": "Test Lease"})
+    
+    path = tmp_path / "blank.pdf"
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+class TestPDFParser:
+    """Tests for PDFParserTool."""
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_parse(self, blank_pdf: Path, backend: str) -> None:
+        """Test parsing returns metadata and one entry per page."""
+        result = PDFParserTool(backend=backend).parse(blank_pdf)
+        
+        assert result.metadata.filename == "blank.pdf"
+        assert result.metadata.page_count == 3
+        assert result.metadata.title == "Test Lease"
+        assert result.metadata.file_size_bytes == blank_pdf.stat().st_size
+        assert [p.page_number for p in result.pages] == [1, 2, 3]
+        assert result.full_text.strip() == ""
+        assert result.total_chars == sum(p.char_count for p in result.pages)
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_parse_page_parallel(self, blank_pdf: Path, backend: str) -> None:
+        """Test page-parallel extraction keeps pages in document order."""
+        parser = PDFParserTool(
+            backend=backend,
+            max_page_workers=2,
+            parallel_page_threshold=2,
+        )
+        
+        result = parser.parse(blank_pdf)
+        
+        assert [p.page_number for p in result.pages] == [1, 2, 3]
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_parse_bytes(self, blank_pdf: Path, backend: str) -> None:
+        """Test parsing from bytes matches parsing from a path."""
+        result = PDFParserTool(backend=backend).parse_bytes(blank_pdf.read_bytes(), "upload.pdf")
+        
+        assert result.metadata.filename == "upload.pdf"
+        assert result.metadata.page_count == 3
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_parse_buffer_types(self, blank_pdf: Path, backend: str) -> None:
+        """Test bytearray and memoryview inputs are accepted."""
+        parser = PDFParserTool(backend=backend)
+        data = blank_pdf.read_bytes()
+        
+        for buffer in (bytearray(data), memoryview(data)):
+            result = parser.parse_bytes(buffer, "upload.pdf")
+            assert result.metadata.page_count == 3
+            assert result.metadata.file_size_bytes == len(data)
+    
+    def test_iter_pages_is_lazy(self, blank_pdf: Path) -> None:
+        """Test iter_pages yields pages one at a time."""
+        pages = PDFParserTool().iter_pages(blank_pdf)
+        
+        assert next(pages).page_number == 1
+        assert len(list(pages)) == 2
+    
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PDFParserTool().parse(tmp_path / "missing.pdf")
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_not_a_pdf(self, tmp_path: Path, backend: str) -> None:
+        """Test non-PDF extensions and invalid content raise ValueError."""
+        text_file = tmp_path / "lease.txt"
+        text_file.write_text("not a pdf")
+        parser = PDFParserTool(backend=backend)
+        
+        with pytest.raises(ValueError, match="not a PDF"):
+            parser.parse(text_file)
+        with pytest.raises(ValueError, match="Invalid PDF"):
+            parser.parse_bytes(b"not a pdf", "broken.pdf")
+    
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_table_detection_is_opt_in(
+        self, blank_pdf: Path, backend: str, monkeypatch
+    ) -> None:
+        """Test pages skip table detection unless detect_tables is set."""
+        calls = []
+        
+        def find_tables(page, *args, **kwargs):
+            calls.append(page)
+            return []
+        
+        if pdf_parser.pymupdf is not None:
+            monkeypatch.setattr(pdf_parser.pymupdf.Page, "find_tables", find_tables)
+        monkeypatch.setattr(pdf_parser.pdfplumber.page.Page, "find_tables", find_tables)
+        
+        result = PDFParserTool(backend=backend).parse(blank_pdf)
+        
+        assert calls == []
+        assert result.table_page_numbers == []
+    
+    def test_pymupdf_fallback(self, monkeypatch) -> None:
+        """Test the backend falls back when PyMuPDF is not installed."""
+        monkeypatch.setattr(pdf_parser, "pymupdf", None)
+        
+        assert PDFParserTool().active_backend == "pdfplumber"
+        assert PDFParserTool(use_pdfplumber=False).active_backend == "pypdf"
+
+
+class TestParsedDocument:
+    """Tests for the column-backed ParsedDocument."""
+    
+    def test_from_pages(self) -> None:
+        """Test page views and aggregates match the source pages."""
+        pages = [
+            PageContent(page_number=1, text="Lease", char_count=5),
+            PageContent(page_number=2, text="Rent table", char_count=10, has_tables=True),
+        ]
+        
+        document = ParsedDocument.from_pages(PDFMetadata(filename="a.pdf", page_count=2), pages)
+        
+        assert len(document) == 2
+        assert document.pages == pages
+        assert document[-1] == pages[1]
+        assert document.total_chars == 15
+        assert document.table_page_numbers == [2]
+        assert document.full_text == "Lease\n\nRent table"
+    
+    def test_slotted_records(self) -> None:
+        """Test page and document records carry no per-instance __dict__."""
+        page = PageContent(page_number=1, text="Lease", char_count=5)
+        document = ParsedDocument.from_pages(PDFMetadata(filename="a.pdf", page_count=1), [page])
+        
+        assert not hasattr(page, "__dict__")
+        assert not hasattr(document, "__dict__")
+        assert document.full_text is document.full_text
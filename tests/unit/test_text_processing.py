@@ -0,0 +1,351 @@
+"""
+Lease Digitizer - Unit Tests for Text Processing
+
+Tests for the TextProcessor and module-level text helpers.
+"""
+
+import time
+
+import pytest
+
+from src.utils import text_processing
+from src.utils.text_processing import (
+    TextProcessor,
+    clean_whitespace,
+    extract_monetary_values,
+)
+
+
+@pytest.fixture
+def processor() -> TextProcessor:
+    """Create a text processor instance."""
+    return TextProcessor()
+
+
+class TestCleanWhitespace:
+    """Tests for whitespace normalization."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("a\r\nb\rc", "a\nb\nc"),
+        ("Base  \t Rent", "Base Rent"),
+        ("a\n\n\n\nb", "a\n\nb"),
+        ("a\r\n\r\n\r\nb", "a\n\nb"),
+        ("a\r\r\nb", "a\n\nb"),
+        ("a\n\rb", "a\n\nb"),
+        ("  padded \n", "padded"),
+        ("", ""),
+        ("already clean\n\ntext", "already clean\n\ntext"),
+    ])
+    def test_clean_whitespace(self, text: str, expected: str) -> None:
+        """Test line endings, runs of spaces and blank lines are normalized."""
+        assert clean_whitespace(text) == expected
+    
+    def test_chunked_matches_whole(self, monkeypatch, sample_lease_text: str) -> None:
+        """Test long texts cleaned in chunks give the same result as one pass."""
+        text = (sample_lease_text + "\r\n\r\n\r\n\t  ") * 20
+        expected = clean_whitespace(text)
+        monkeypatch.setattr(text_processing, "_CLEAN_CHUNK_CHARS", 64)
+        
+        assert clean_whitespace(text) == expected
+    
+    def test_clean_text_matches_clean_whitespace(
+        self, processor: TextProcessor, sample_lease_text: str
+    ) -> None:
+        """Test clean_text applies the same normalization."""
+        assert processor.clean_text(sample_lease_text) == clean_whitespace(sample_lease_text)
+    
+    def test_clean_text_is_memoized(self, processor: TextProcessor) -> None:
+        """Test repeated cleaning of the same text is served from the cache."""
+        text_processing._clean_text_cached.cache_clear()
+        
+        first = processor.clean_text("Base  Rent")
+        second = TextProcessor().clean_text("Base  Rent")
+        
+        assert first == second == "Base Rent"
+        assert text_processing._clean_text_cached.cache_info().hits == 1
+    
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_clean_text_batch(
+        self, processor: TextProcessor, sample_lease_text: str, max_workers: int
+    ) -> None:
+        """Test batch cleaning matches cleaning each text, in input order."""
+        texts = [sample_lease_text, "", "Base  Rent\r\n", sample_lease_text.upper()]
+        
+        result = processor.clean_text_batch(texts, max_workers=max_workers)
+        
+        assert result == [processor.clean_text(text) for text in texts]
+    
+    def test_clean_text_empty(self, processor: TextProcessor) -> None:
+        """Test empty input yields an empty string."""
+        assert processor.clean_text("") == ""
+
+
+class TestFixOcrErrors:
+    """Tests for OCR error correction."""
+    
+    def test_fix_ocr_errors(self, processor: TextProcessor) -> None:
+        """Test look-alike letters are corrected inside numeric tokens."""
+        assert processor.fix_ocr_errors("Rent of $l2,5OO.OO due 2O24, Suite 4lO") == (
+            "Rent of $12,500.00 due 2024, Suite 410"
+        )
+    
+    def test_extended_table(self) -> None:
+        """Test corrections added to OCR_CORRECTIONS after import are applied."""
+        processor = TextProcessor()
+        processor.OCR_CORRECTIONS = {**TextProcessor.OCR_CORRECTIONS, "S": "5"}
+        
+        assert processor.fix_ocr_errors("$1,S0O due") == "$1,500 due"
+        assert TextProcessor().fix_ocr_errors("$1,S0O due") == "$1,S0O due"
+    
+    def test_words_unchanged(self, processor: TextProcessor) -> None:
+        """Test ordinary words and lone letters are never corrected."""
+        text = "Tenant shall return the premises per this clause; include l and O. Lot 1st 10th"
+        assert processor.fix_ocr_errors(text) == text
+    
+    def test_ligatures_expanded(self, processor: TextProcessor) -> None:
+        """Test ligature glyphs are replaced by their letters."""
+        assert processor.fix_ocr_errors("\ufb01nal a\ufb03davit") == "final affidavit"
+    
+    def test_fix_ocr_errors_empty(self, processor: TextProcessor) -> None:
+        """Test empty input yields an empty string."""
+        assert processor.fix_ocr_errors("") == ""
+
+
+class TestExtractKeywords:
+    """Tests for keyword extraction."""
+    
+    def test_default_keywords(self, processor: TextProcessor, sample_lease_text: str) -> None:
+        """Test the built-in lease keywords are found case-insensitively."""
+        keywords = processor.extract_keywords(sample_lease_text)
+        
+        assert set(keywords) == {"base rent", "security deposit"}
+        assert len(keywords["base rent"]) == 2
+        assert "Tenant shall pay Base Rent of $50,000.00" in keywords["base rent"][1]
+    
+    def test_whole_words_only(self, processor: TextProcessor) -> None:
+        """Test keywords inside longer words are not reported."""
+        keywords = processor.extract_keywords(
+            "The term may be renewed; see termination.", ["term"]
+        )
+        
+        assert keywords == {"term": ["The term may be renewed; see termination."]}
+    
+    def test_automaton_reused(self, processor: TextProcessor) -> None:
+        """Test the automaton is built once per keyword set, in any order."""
+        pytest.importorskip("ahocorasick")
+        text_processing._keyword_automaton.cache_clear()
+        
+        processor.extract_keywords("Base rent is due.", ["rent", "base rent"])
+        processor.extract_keywords("Rent is due.", ["base rent", "rent"])
+        
+        info = text_processing._keyword_automaton.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+    
+    def test_fallback_matches_automaton(
+        self, processor: TextProcessor, monkeypatch, sample_lease_text: str
+    ) -> None:
+        """Test the per-keyword regex fallback finds the same contexts."""
+        keywords = ["Tenant", "rent", "Base Rent", "premises"]
+        expected = processor.extract_keywords(sample_lease_text, keywords)
+        monkeypatch.setattr(text_processing, "ahocorasick", None)
+        
+        assert processor.extract_keywords(sample_lease_text, keywords) == expected
+
+
+class TestFindDefinedTerms:
+    """Tests for defined term extraction."""
+    
+    def test_all_forms(self, processor: TextProcessor) -> None:
+        """Test means, shall mean and parenthetical definitions in one text."""
+        text = (
+            '"Landlord" means ABC Properties LLC, a Delaware company. '
+            "For purposes hereof, the term \u201cPremises\u201d shall mean Suite 500; "
+            'and Tenant shall pay minimum monthly rent ("Base Rent").'
+        )
+        
+        assert processor.find_defined_terms(text) == {
+            "Landlord": "ABC Properties LLC, a Delaware company",
+            "Premises": "Suite 500",
+            "Base Rent": "Tenant shall pay minimum monthly rent",
+        }
+    
+    def test_parenthetical_parties(self, processor: TextProcessor) -> None:
+        """Test each parenthetical stops at the definition before it."""
+        text = (
+            'This Lease Agreement ("Lease") is made by and between ABC Properties LLC, '
+            'a Texas limited liability company ("Landlord"), and XYZ Corporation, '
+            'a Delaware corporation ("Tenant").'
+        )
+        
+        assert processor.find_defined_terms(text) == {
+            "Lease": "This Lease Agreement",
+            "Landlord": "ABC Properties LLC, a Texas limited liability company",
+            "Tenant": "XYZ Corporation, a Delaware corporation",
+        }
+    
+    def test_first_definition_wins(
+        self, processor: TextProcessor, sample_amendment_text: str
+    ) -> None:
+        """Test a term defined twice keeps its first definition."""
+        terms = processor.find_defined_terms(sample_amendment_text)
+        
+        assert terms["Amendment"] == "This First Amendment to Lease"
+        assert terms["Lease"].endswith("Commercial Lease Agreement dated January 15, 2024")
+
+
+class TestSplitSections:
+    """Tests for section splitting."""
+    
+    def test_split_sections(self, processor: TextProcessor, sample_lease_text: str) -> None:
+        """Test each header starts a section holding the text up to the next."""
+        sections = processor.split_sections(sample_lease_text)
+        
+        assert [header for header, _ in sections] == [
+            "COMMERCIAL LEASE AGREEMENT",
+            "ARTICLE 1. PREMISES",
+            "ARTICLE 2. TERM",
+            "ARTICLE 3. BASE RENT",
+            "ARTICLE 4. SECURITY DEPOSIT",
+        ]
+        assert sections[3][1] == (
+            "Tenant shall pay Base Rent of $50,000.00 per month ($600,000.00 annually)."
+        )
+    
+    def test_preamble_and_no_headers(self, processor: TextProcessor) -> None:
+        """Test text before the first header is kept under an empty header."""
+        assert processor.split_sections("Preamble.\nSection 1.1 Use\nOffice.") == [
+            ("", "Preamble."),
+            ("Section 1.1 Use", "Office."),
+        ]
+        assert processor.split_sections("No headers here.") == [("", "No headers here.")]
+        assert processor.split_sections("") == []
+    
+    def test_many_sections(self, processor: TextProcessor) -> None:
+        """Test every header gets exactly its own body, including empty ones."""
+        text = "\n".join(f"Section {i}. Clause\nBody {i}." for i in range(1, 201))
+        text += "\nSection 201. Empty"
+        
+        sections = processor.split_sections(text)
+        
+        assert len(sections) == 201
+        assert sections[99] == ("Section 100. Clause", "Body 100.")
+        assert sections[-1] == ("Section 201. Empty", "")
+    
+    def test_header_form_is_identified(self) -> None:
+        """Test the matched alternative names the SECTION_PATTERNS entry."""
+        matches = TextProcessor._SECTION_RE.finditer("ARTICLE 4. USE\nSection 4.1 Permitted\n")
+        
+        assert [m.lastgroup for m in matches] == ["p0", "p1"]
+    
+    def test_stdlib_fallback_rejects_long_space_runs(self, monkeypatch) -> None:
+        """Test a long run of spaces without a header end fails without backtracking."""
+        monkeypatch.setattr(text_processing, "re2", None)
+        fallback = text_processing._build_section_pattern(TextProcessor.SECTION_PATTERNS)
+        
+        assert fallback.search("A" + " " * 20000 + "x") is None
+        assert fallback.search("RECITALS:  ").group(0) == "RECITALS:  "
+    
+    def test_stdlib_fallback_matches_same_headers(
+        self, monkeypatch, sample_amendment_text: str
+    ) -> None:
+        """Test the stdlib regex fallback finds the same headers as the default engine."""
+        default = text_processing._SECTION_RE
+        monkeypatch.setattr(text_processing, "re2", None)
+        fallback = text_processing._build_section_pattern(TextProcessor.SECTION_PATTERNS)
+        
+        assert [m.group(0) for m in fallback.finditer(sample_amendment_text)] == [
+            m.group(0) for m in default.finditer(sample_amendment_text)
+        ]
+    
+    def test_non_ascii_digit_headers(self, monkeypatch) -> None:
+        """Test both engines accept headers numbered with non-ASCII digits."""
+        text = "Section \uff15.1 Rent\n\u0663. Term\nARTICLE \uff17 USE\n"
+        default = text_processing._SECTION_RE
+        monkeypatch.setattr(text_processing, "re2", None)
+        fallback = text_processing._build_section_pattern(TextProcessor.SECTION_PATTERNS)
+        
+        headers = [m.group(0) for m in default.finditer(text)]
+        
+        assert len(headers) == 3
+        assert headers == [m.group(0) for m in fallback.finditer(text)]
+
+
+class TestExtractPartyNames:
+    """Tests for party extraction."""
+    
+    def test_labelled_lines(self, processor: TextProcessor, sample_lease_text: str) -> None:
+        """Test 'ROLE: Name' lines yield the name up to its description."""
+        assert processor.extract_party_names(sample_lease_text) == {
+            "Landlord": ["ABC Properties LLC"],
+            "Tenant": ["XYZ Corporation"],
+        }
+    
+    def test_role_parentheticals(self, processor: TextProcessor) -> None:
+        """Test names introduced with a role parenthetical are found."""
+        text = (
+            "by and between ABC Properties LLC, a Delaware limited liability company "
+            '("Landlord"), and XYZ Corporation (the \u201cTenant\u201d). '
+            'John Smith ("Guarantor") guarantees the Lease.'
+        )
+        
+        assert processor.extract_party_names(text) == {
+            "Landlord": ["ABC Properties LLC"],
+            "Tenant": ["XYZ Corporation"],
+            "Guarantor": ["John Smith"],
+        }
+    
+    def test_long_capitalized_run_is_linear(self, processor: TextProcessor) -> None:
+        """Test ALL-CAPS boilerplate without a role does not backtrack."""
+        text = " ".join(["NOTWITHSTANDING"] * 20_000)
+        
+        start = time.perf_counter()
+        assert processor.extract_party_names(text) == {}
+        assert time.perf_counter() - start < 1.0
+
+
+class TestTruncateForContext:
+    """Tests for token-budget truncation."""
+    
+    def test_short_text_unchanged(self, processor: TextProcessor) -> None:
+        """Test text within the budget is returned as is."""
+        assert processor.truncate_for_context("Base Rent", max_tokens=10) == "Base Rent"
+    
+    def test_keeps_whole_sections(self, processor: TextProcessor) -> None:
+        """Test only whole leading sections that fit the budget are kept."""
+        text = "\n".join(f"Section {i}. Clause\n" + "word " * 20 for i in range(1, 6))
+        
+        result = processor.truncate_for_context(text, max_tokens=70)
+        
+        assert result.startswith("Section 1. Clause")
+        assert "Section 2. Clause" in result
+        assert "Section 3. Clause" not in result
+        assert len(result) <= 70 * 4
+    
+    def test_word_boundary_cut(self, processor: TextProcessor) -> None:
+        """Test text is cut between words when sections are not preserved."""
+        result = processor.truncate_for_context(
+            "alpha beta gamma delta", max_tokens=3, preserve_sections=False
+        )
+        
+        assert result == "alpha beta"
+
+
+class TestExtractMonetaryValues:
+    """Tests for dollar amount extraction."""
+    
+    def test_sample_lease(self, sample_lease_text: str) -> None:
+        """Test every amount in the lease is found in document order."""
+        assert extract_monetary_values(sample_lease_text) == [
+            ("$50,000.00", 50000.0),
+            ("$600,000.00", 600000.0),
+            ("$100,000.00", 100000.0),
+        ]
+    
+    def test_formats(self) -> None:
+        """Test amounts without cents, with a space, and before punctuation."""
+        assert extract_monetary_values("$1000, then $ 2,500 and $3.5.") == [
+            ("$1000", 1000.0),
+            ("$ 2,500", 2500.0),
+            ("$3.5", 3.5),
+        ]
+        assert extract_monetary_values("No amounts here, $ only.") == []